@@ -5,14 +5,20 @@ middleware configuration, route registration, and application lifecycle
 management for the template agent service.
 """
 
+import asyncio
+import contextlib
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from psycopg_pool import AsyncConnectionPool
 
-from template_agent.src.core.agent import get_template_agent
+from template_agent.src.core.agent import (
+    ensure_checkpoints_user_id_index,
+    get_template_agent,
+)
 from template_agent.src.core.exceptions.exceptions import AppException, AppExceptionCode
 from template_agent.src.routes.feedback import router as feedback_router
 from template_agent.src.routes.health import router as health_router
@@ -22,7 +28,7 @@ from template_agent.src.routes.threads import router as threads_router
 from template_agent.src.settings import settings
 from template_agent.utils.pylogger import get_python_logger
 
-logger = get_python_logger(settings.PYTHON_LOG_LEVEL)
+logger = get_python_logger(settings.PYTHON_LOG_LEVEL, name=__name__)
 
 
 @asynccontextmanager
@@ -30,8 +36,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Configure application lifespan with database initialization.
 
     This context manager handles the application startup and shutdown
-    lifecycle. It initializes the template agent with database connections
-    and ensures proper cleanup on shutdown.
+    lifecycle. It initializes the template agent with database connections,
+    opens the shared PostgreSQL connection pool (stored on
+    ``app.state.db_pool``) when persistent storage is enabled, and ensures
+    proper cleanup on shutdown.
 
     Args:
         app: The FastAPI application instance to manage.
@@ -43,17 +51,41 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         Exception: If there are issues with agent initialization or
             database connections during startup.
     """
+    app.state.db_pool = None
+    index_task = None
     try:
+        if not settings.USE_INMEMORY_SAVER:
+            # Process-wide pool reused by routes that query PostgreSQL directly
+            app.state.db_pool = AsyncConnectionPool(
+                settings.database_uri,
+                min_size=settings.POSTGRES_POOL_MIN_SIZE,
+                max_size=settings.POSTGRES_POOL_MAX_SIZE,
+                open=False,
+            )
+            await app.state.db_pool.open()
+
         # Initialize the template agent with database connections
         async with get_template_agent():
+            if not settings.USE_INMEMORY_SAVER:
+                # One-time index build after the checkpoint tables exist; run in
+                # the background so a long concurrent build doesn't delay startup
+                index_task = asyncio.create_task(ensure_checkpoints_user_id_index())
             yield
     except Exception as e:
         app.logger.error(f"Error during database/store initialization: {e}")
         raise
+    finally:
+        if index_task is not None:
+            index_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await index_task
+        if app.state.db_pool is not None:
+            await app.state.db_pool.close()
 
 
-# Create FastAPI application with lifespan management
-app = FastAPI(lifespan=lifespan)
+# Create FastAPI application with lifespan management; JSON responses are
+# serialized with orjson by default
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Configure CORS middleware for cross-origin requests
 app.add_middleware(
@@ -65,7 +97,7 @@ app.add_middleware(
 )
 
 # Configure application logger
-app.logger = get_python_logger(settings.PYTHON_LOG_LEVEL)
+app.logger = get_python_logger(settings.PYTHON_LOG_LEVEL, name=__name__)
 
 # Register all route handlers
 app.include_router(health_router)
@@ -82,7 +114,7 @@ async def generic_exception_handler(request: Request, exc: Exception):
         f"Unhandled exception occurred for request_method={request.method}, request_path={request.url.path}, error={exc}"
     )
     logger.debug(f"Unhandled exception occurred for request={request}, error={exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=AppExceptionCode.INTERNAL_SERVER_ERROR.response_code,
         content={
             "detail_message": str(exc),
@@ -99,7 +131,7 @@ async def app_exception_handler(request: Request, exc: AppException):
         f"App exception occurred for request_method={request.method}, request_path={request.url.path}, error={exc}"
     )
     logger.debug(f"App exception occurred for request={request}, error={exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.response_code,
         content={
             "detail_message": exc.detail_message,
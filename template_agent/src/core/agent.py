@@ -5,20 +5,95 @@ including initialization, configuration, and agent creation utilities.
 """
 
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Any, Optional
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from langgraph.prebuilt import create_react_agent
+from psycopg import AsyncConnection
 
 from template_agent.src.core.exceptions.exceptions import AppException, AppExceptionCode
 from template_agent.src.core.prompt import get_system_prompt
 from template_agent.src.core.storage import get_global_checkpoint
 from template_agent.src.settings import settings
+from template_agent.utils.google_creds import get_google_credentials
 from template_agent.utils.pylogger import get_python_logger
 
-logger = get_python_logger(log_level=settings.PYTHON_LOG_LEVEL)
+logger = get_python_logger(settings.PYTHON_LOG_LEVEL, name=__name__)
+
+# Functional index backing the per-user thread lookup in the threads route
+CHECKPOINTS_USER_ID_INDEX = "idx_checkpoints_user_id"
+CHECKPOINTS_USER_ID_INDEX_SQL = (
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {CHECKPOINTS_USER_ID_INDEX} "
+    "ON checkpoints ((metadata->>'user_id'))"
+)
+# A failed concurrent build leaves an INVALID index that IF NOT EXISTS skips
+CHECKPOINTS_USER_ID_INDEX_VALID_SQL = (
+    "SELECT i.indisvalid FROM pg_index i "
+    "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = %s"
+)
+# An index still being built concurrently is also INVALID until it finishes
+CHECKPOINTS_INDEX_BUILD_IN_PROGRESS_SQL = (
+    "SELECT EXISTS (SELECT 1 FROM pg_stat_progress_create_index "
+    "WHERE relid = 'checkpoints'::regclass)"
+)
+# Advisory lock key serializing the index check-and-build across replicas
+CHECKPOINTS_USER_ID_INDEX_LOCK_KEY = 0x6964785F75736572
+
+
+async def _fetch_value(conn: AsyncConnection, query: str, params: Any = None) -> Any:
+    """Run a query and return the first column of its first row, or None."""
+    cur = await conn.execute(query, params)
+    row = await cur.fetchone()
+    return None if row is None else row[0]
+
+
+async def ensure_checkpoints_user_id_index() -> None:
+    """Create the checkpoints user_id index once, rebuilding it if invalid.
+
+    Intended to run once per process at startup, after the checkpoint tables
+    exist. CREATE INDEX CONCURRENTLY cannot run inside a transaction, so a
+    dedicated autocommit connection is used rather than a pooled one. The
+    check-and-build holds a session advisory lock, so when several replicas
+    start together only one of them builds and the others skip. An index
+    left INVALID by an interrupted build is dropped and rebuilt, unless a
+    build on the checkpoints table is still in progress. Failures are logged
+    and do not stop the service; thread lookups still work without the
+    index, only slower.
+    """
+    try:
+        async with await AsyncConnection.connect(
+            settings.database_uri, autocommit=True
+        ) as conn:
+            if not await _fetch_value(
+                conn,
+                "SELECT pg_try_advisory_lock(%s)",
+                (CHECKPOINTS_USER_ID_INDEX_LOCK_KEY,),
+            ):
+                logger.info(
+                    f"Index {CHECKPOINTS_USER_ID_INDEX} is being checked elsewhere"
+                )
+                return
+            valid = await _fetch_value(
+                conn, CHECKPOINTS_USER_ID_INDEX_VALID_SQL, (CHECKPOINTS_USER_ID_INDEX,)
+            )
+            if valid:
+                return
+            if valid is not None:
+                if await _fetch_value(conn, CHECKPOINTS_INDEX_BUILD_IN_PROGRESS_SQL):
+                    logger.info(
+                        f"Index {CHECKPOINTS_USER_ID_INDEX} is still being built"
+                    )
+                    return
+                logger.warning(f"Rebuilding invalid index {CHECKPOINTS_USER_ID_INDEX}")
+                await conn.execute(
+                    f"DROP INDEX CONCURRENTLY IF EXISTS {CHECKPOINTS_USER_ID_INDEX}"
+                )
+            await conn.execute(CHECKPOINTS_USER_ID_INDEX_SQL)
+            logger.info(f"Created index {CHECKPOINTS_USER_ID_INDEX}")
+    except Exception as e:
+        logger.error(f"Could not create index {CHECKPOINTS_USER_ID_INDEX}: {e}")
 
 
 @asynccontextmanager
@@ -74,7 +149,13 @@ async def get_template_agent(
             )
 
     # Initialize the language model
-    model = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0.3)
+    # In-memory service account credentials take precedence; when None the
+    # client falls back to GOOGLE_APPLICATION_CREDENTIALS / default credentials
+    model = ChatGoogleGenerativeAI(
+        model="gemini-2.5-flash",
+        temperature=0.3,
+        credentials=get_google_credentials(),
+    )
 
     if not enable_checkpointing:
         # Create agent without checkpointing for streaming-only operations
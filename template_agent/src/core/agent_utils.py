@@ -54,6 +54,12 @@ def langchain_to_chat_message(message: BaseMessage) -> ChatMessage:
     format used by the template agent. It handles different message types and
     preserves relevant metadata.
 
+    AI and tool messages are produced by the agent and every field is
+    normalised here (content to ``str``, tool calls rebuilt field by field),
+    so they are built with ``model_construct`` and skip Pydantic validation on
+    the streaming path. Human and custom messages carry user-supplied content,
+    including from checkpoint history, so they are still validated.
+
     Args:
         message: The LangChain message to convert. Must be one of the supported
             message types (HumanMessage, AIMessage, ToolMessage, or ChatMessage).
@@ -73,7 +79,7 @@ def langchain_to_chat_message(message: BaseMessage) -> ChatMessage:
             return human_message
 
         case AIMessage():
-            ai_message = ChatMessage(
+            ai_message = ChatMessage.model_construct(
                 type="ai",
                 content=convert_message_content_to_string(message.content),
             )
@@ -112,7 +118,7 @@ def langchain_to_chat_message(message: BaseMessage) -> ChatMessage:
             return ai_message
 
         case ToolMessage():
-            tool_message = ChatMessage(
+            tool_message = ChatMessage.model_construct(
                 type="tool",
                 content=convert_message_content_to_string(message.content),
                 tool_call_id=message.tool_call_id,
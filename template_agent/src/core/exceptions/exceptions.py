@@ -47,6 +47,10 @@ class AppExceptionCode(Enum):
         self._response_code = response_code
         self._message = message
         self._error_code = error_code
+        # Members are immutable, so the log string is formatted once
+        self._str = (
+            f"response_code={response_code}, message={message}, error_code={error_code}"
+        )
 
     @property
     def response_code(self):
@@ -65,12 +69,16 @@ class AppExceptionCode(Enum):
 
     def __str__(self):
         """Str method for logging the exception code."""
-        return f"response_code={self.response_code}, message={self.message}, error_code={self.error_code}"
+        return self._str
 
 
 class AppException(Exception):
     """Base exception for application."""
 
+    # BaseException only allocates its __dict__ on first use, so keeping our
+    # fields in slots avoids that allocation for every raised exception
+    __slots__ = ("_detail_message", "_app_exception_code", "_str")
+
     def __init__(
         self,
         detail_message: str,
@@ -79,6 +87,8 @@ class AppException(Exception):
         """Constructor to initialize the exception."""
         self._detail_message = detail_message
         self._app_exception_code = app_exception_code
+        # Neither field changes after construction, so format the log string once
+        self._str = f"response_code={app_exception_code.response_code}, message={app_exception_code.message}, detail_message={detail_message}, error_code={app_exception_code.error_code}"
         super().__init__(detail_message)
 
     @property
@@ -103,12 +113,14 @@ class AppException(Exception):
 
     def __str__(self):
         """Str method for logging the exception."""
-        return f"response_code={self.response_code}, message={self.message}, detail_message={self.detail_message}, error_code={self.error_code}"
+        return self._str
 
 
 class ToolCallException(AppException):
     """Raised when Tool call fails."""
 
+    __slots__ = ()
+
     def __init__(self, detail_message: str):
         """Constructor to initialize the ToolCallException."""
         super().__init__(detail_message, AppExceptionCode.TOOL_CALL_ERROR)
@@ -121,6 +133,8 @@ class ToolCallException(AppException):
 class UnauthorizedException(AppException):
     """Raised when user Authentication fails."""
 
+    __slots__ = ()
+
     def __init__(self, detail_message: str):
         """Constructor to initialize the UnauthorizedException."""
         super().__init__(detail_message, AppExceptionCode.UNAUTHORISED_ACCESS_ERROR)
@@ -133,6 +147,8 @@ class UnauthorizedException(AppException):
 class ForbiddenException(AppException):
     """Raised when user is forbidden."""
 
+    __slots__ = ()
+
     def __init__(self, detail_message: str):
         """Constructor to initialize the ForbiddenException."""
         super().__init__(detail_message, AppExceptionCode.FORBIDDEN_ACCESS_ERROR)
@@ -37,7 +37,10 @@ langfuse_handler = CallbackHandler(
     trace_name="agent-redhat", environment=settings.LANGFUSE_TRACING_ENVIRONMENT
 )
 
-app_logger = get_python_logger(settings.PYTHON_LOG_LEVEL)
+app_logger = get_python_logger(settings.PYTHON_LOG_LEVEL, name=__name__)
+
+# Constructor parameters accepted by AIMessage, resolved once at import
+_AI_MESSAGE_KEYS = frozenset(inspect.signature(AIMessage).parameters)
 
 
 class AgentManager:
@@ -59,7 +62,7 @@ class AgentManager:
         self._current_tool_call_id: str | None = None  # Track current active tool call
 
     async def stream_response(
-        self, request: StreamRequest
+        self, request: StreamRequest, suppress_human_echo: bool = False
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Stream agent response with simplified event structure.
 
@@ -68,6 +71,8 @@ class AgentManager:
 
         Args:
             request: The streaming request containing user input and configuration.
+            suppress_human_echo: Whether to skip the message event that echoes
+                the user's own input back as a human message.
 
         Yields:
             Simplified event dictionaries with 'type' and 'content' fields.
@@ -114,8 +119,13 @@ class AgentManager:
                     )
 
                     for formatted_event in formatted_events:
-                        if formatted_event:
-                            yield formatted_event
+                        if not formatted_event:
+                            continue
+                        if suppress_human_echo and self._is_human_echo(
+                            formatted_event, request.message
+                        ):
+                            continue
+                        yield formatted_event
 
                 # No manual state saving needed - LangGraph handles this automatically
                 app_logger.info(
@@ -438,9 +448,7 @@ class AgentManager:
 
     def _create_ai_message(self, parts: Dict[str, Any]) -> AIMessage:
         """Create an AIMessage from a dictionary of parts (preserved from original)."""
-        sig = inspect.signature(AIMessage)
-        valid_keys = set(sig.parameters)
-        filtered = {k: v for k, v in parts.items() if k in valid_keys}
+        filtered = {k: v for k, v in parts.items() if k in _AI_MESSAGE_KEYS}
         return AIMessage(**filtered)
 
     def _convert_chat_message_to_simple_format(
@@ -472,6 +480,18 @@ class AgentManager:
 
         return content
 
+    @staticmethod
+    def _is_human_echo(event: Dict[str, Any], message: str) -> bool:
+        """Check whether an event echoes the user's input as a human message.
+
+        Token and error events are rejected on the type check alone, so the
+        string comparison only runs for message events.
+        """
+        if event["type"] != "message":
+            return False
+        content = event["content"]
+        return content["type"] == "human" and content["content"] == message
+
     def _extract_tool_call_id_from_message(self, msg: AIMessageChunk) -> str | None:
         """Extract tool call ID from an AIMessageChunk if available.
 
@@ -4,6 +4,7 @@ This module contains the system prompts and related utilities used by the
 template agent to provide consistent behavior and instructions.
 """
 
+import functools
 from datetime import datetime
 
 
@@ -26,8 +27,19 @@ def get_system_prompt() -> str:
     Returns:
         The complete system prompt string with current date and instructions.
     """
-    current_date = get_current_date()
+    return _build_prompt(get_current_date())
 
+
+@functools.lru_cache(maxsize=1)
+def _build_prompt(current_date: str) -> str:
+    """Build the system prompt for a given date, cached until the date changes.
+
+    Args:
+        current_date: The formatted date to include in the prompt.
+
+    Returns:
+        The complete system prompt string.
+    """
     return (
         f"You are Template Agent, a powerful and helpful assistant with the ability to use specialized tools.\n\n"
         f"Today's date is {current_date}.\n\n"
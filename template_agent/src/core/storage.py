@@ -4,22 +4,20 @@ This module provides a single global checkpoint instance that persists across
 the entire application lifecycle when using in-memory storage mode.
 """
 
-from typing import Optional
+import functools
 
 from langgraph.checkpoint.memory import InMemorySaver
 
 from template_agent.src.settings import settings
 from template_agent.utils.pylogger import get_python_logger
 
-logger = get_python_logger(settings.PYTHON_LOG_LEVEL)
-
-# Global checkpoint instance - single instance for the entire application lifecycle
-_global_checkpoint: Optional[InMemorySaver] = None
+logger = get_python_logger(settings.PYTHON_LOG_LEVEL, name=__name__)
 
 # Global thread registry to track threads by user_id
 _thread_registry: dict[str, set[str]] = {}
 
 
+@functools.cache
 def get_global_checkpoint() -> InMemorySaver:
     """Get the global in-memory checkpoint instance.
 
@@ -30,11 +28,9 @@ def get_global_checkpoint() -> InMemorySaver:
     Returns:
         The global InMemorySaver instance.
     """
-    global _global_checkpoint
-    if _global_checkpoint is None:
-        _global_checkpoint = InMemorySaver()
-        logger.info("Created global InMemorySaver checkpoint instance")
-    return _global_checkpoint
+    checkpoint = InMemorySaver()
+    logger.info("Created global InMemorySaver checkpoint instance")
+    return checkpoint
 
 
 def register_thread(user_id: str, thread_id: str) -> None:
@@ -71,8 +67,8 @@ def reset_global_storage() -> None:
 
     This is useful for testing or when you want to clear all data.
     """
-    global _global_checkpoint, _thread_registry
-    _global_checkpoint = None
+    global _thread_registry
+    get_global_checkpoint.cache_clear()
     _thread_registry = {}
     logger.info("Reset global checkpoint instance and thread registry")
 
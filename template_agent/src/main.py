@@ -18,7 +18,7 @@ from template_agent.utils.google_creds import initialize_google_genai
 from template_agent.utils.pylogger import get_python_logger, get_uvicorn_log_config
 
 # Initialize logger
-logger = get_python_logger(settings.PYTHON_LOG_LEVEL)
+logger = get_python_logger(settings.PYTHON_LOG_LEVEL, name=__name__)
 
 
 def validate_and_initialize_config() -> None:
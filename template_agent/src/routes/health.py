@@ -5,13 +5,12 @@ and availability of the template agent service.
 """
 
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
 
 router = APIRouter()
 
 
 @router.get("/health")
-async def health_check() -> JSONResponse:
+async def health_check() -> dict[str, str]:
     """Perform a health check on the template agent service.
 
     This endpoint is used to verify that the service is running and
@@ -19,6 +18,7 @@ async def health_check() -> JSONResponse:
     the service status.
 
     Returns:
-        A JSONResponse containing the service status and name.
+        A dictionary containing the service status and name, serialized by
+        the application's default response class.
     """
-    return JSONResponse(content={"status": "healthy", "service": "Template Agent"})
+    return {"status": "healthy", "service": "Template Agent"}
@@ -6,7 +6,6 @@ allowing users to view previous conversations and continue ongoing threads.
 
 from typing import List
 
-import psycopg2
 from fastapi import APIRouter, Request
 from langchain_core.runnables import RunnableConfig
 
@@ -18,7 +17,7 @@ from template_agent.utils.pylogger import get_python_logger
 
 router = APIRouter()
 
-logger = get_python_logger(settings.PYTHON_LOG_LEVEL)
+logger = get_python_logger(settings.PYTHON_LOG_LEVEL, name=__name__)
 
 
 @router.get("/v1/history/{thread_id}")
@@ -36,7 +35,8 @@ async def history(thread_id: str, request: Request) -> ChatHistoryResponse:
     Args:
         thread_id: The unique identifier of the thread to retrieve history for.
         request: The FastAPI request object, used to extract headers like
-            X-Token for authentication.
+            X-Token for authentication and to reach the shared database
+            connection pool.
 
     Returns:
         A ChatHistoryResponse containing the list of chat messages for the thread.
@@ -212,17 +212,19 @@ async def history(thread_id: str, request: Request) -> ChatHistoryResponse:
             return ChatHistoryResponse(messages=[])
 
     try:
-        # Connect to PostgreSQL and read from checkpoints table
-        with psycopg2.connect(settings.database_uri) as conn:
-            cur = conn.cursor()
-
+        # Borrow a pooled connection and read from checkpoints table without
+        # blocking the event loop
+        async with (
+            request.app.state.db_pool.connection() as conn,
+            conn.cursor() as cur,
+        ):
             # Query the checkpoints table for the specific thread_id
             # Get the latest checkpoint first (which should contain complete conversation state)
-            cur.execute(
+            await cur.execute(
                 "SELECT checkpoint, metadata FROM checkpoints WHERE thread_id = %s ORDER BY checkpoint_id DESC LIMIT 1",
                 (thread_id,),
             )
-            latest_row = cur.fetchone()
+            latest_row = await cur.fetchone()
 
             if latest_row:
                 logger.info(f"Found latest checkpoint for thread_id: {thread_id}")
@@ -305,11 +307,11 @@ async def history(thread_id: str, request: Request) -> ChatHistoryResponse:
             logger.info(
                 "Latest checkpoint didn't contain messages, falling back to processing all checkpoints"
             )
-            cur.execute(
+            await cur.execute(
                 "SELECT checkpoint, metadata FROM checkpoints WHERE thread_id = %s ORDER BY checkpoint_id ASC",
                 (thread_id,),
             )
-            rows = cur.fetchall()
+            rows = await cur.fetchall()
 
             logger.info(f"Found {len(rows)} checkpoints for thread_id: {thread_id}")
 
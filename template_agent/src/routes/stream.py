@@ -4,12 +4,14 @@ This module provides streaming endpoints for real-time agent interactions,
 handling message streaming, token generation, and conversation management.
 """
 
-import json
+import asyncio
+import contextlib
 from collections.abc import AsyncGenerator
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Request, status
-from fastapi.responses import StreamingResponse
+from sse_starlette.sse import EventSourceResponse
 
 from template_agent.src.core.manager import AgentManager
 from template_agent.src.schema import StreamRequest
@@ -17,12 +19,141 @@ from template_agent.src.settings import settings
 from template_agent.utils.pylogger import get_python_logger
 
 router = APIRouter()
-app_logger = get_python_logger(settings.PYTHON_LOG_LEVEL)
+app_logger = get_python_logger(settings.PYTHON_LOG_LEVEL, name=__name__)
+
+# Response headers shared by every stream; copied by the response on use
+_SSE_HEADERS = {"Cache-Control": "no-cache"}
+
+# Token events are coalesced into one write until either limit is reached
+SSE_COALESCE_MAX_BYTES = 8192
+SSE_COALESCE_WINDOW_SECONDS = 0.005
+# Events read ahead of the client before the agent stream is paused
+SSE_COALESCE_QUEUE_SIZE = 64
+
+# Pre-encoded framing for plain token events, the bulk of a token stream
+_TOKEN_EVENT_PREFIX = b'{"type":"token","content":'
+_TOKEN_EVENT_SUFFIX = b"}\n\n"
+
+# Marks the end of the event stream in the coalescing queue
+_STREAM_END = object()
+
+# Fixed records sent when the stream fails and when it completes
+_STREAM_ERROR_RECORD = (
+    orjson.dumps(
+        {
+            "type": "error",
+            "content": {
+                "message": "Internal server error",
+                "recoverable": False,
+                "error_type": "stream_error",
+            },
+        }
+    )
+    + b"\n\n"
+)
+_DONE_RECORD = b"[DONE]\n\n"
+
+
+def _encode_event(event: dict[str, Any]) -> bytes:
+    """Encode a stream event as an SSE record.
+
+    Plain token events ({"type": "token", "content": <str>}) only need their
+    content serialized; the surrounding JSON is a pre-encoded template. All
+    other events are serialized in full.
+
+    Args:
+        event: The simplified event produced by the AgentManager.
+
+    Returns:
+        The JSON-encoded event followed by the SSE record separator.
+    """
+    if len(event) == 2 and event.get("type") == "token":
+        content = event.get("content")
+        if isinstance(content, str):
+            return _TOKEN_EVENT_PREFIX + orjson.dumps(content) + _TOKEN_EVENT_SUFFIX
+    return orjson.dumps(event) + b"\n\n"
+
+
+async def _coalesce_events(
+    events: AsyncGenerator[dict[str, Any], None],
+) -> AsyncGenerator[bytes, None]:
+    """Encode events, batching consecutive token events into single chunks.
+
+    Each yielded chunk becomes one ASGI send, so fast token streams are
+    buffered for up to SSE_COALESCE_WINDOW_SECONDS or SSE_COALESCE_MAX_BYTES,
+    whichever comes first. Any non-token event flushes the buffer together
+    with itself immediately. Every event remains a complete SSE record, so
+    framing is unchanged. At most SSE_COALESCE_QUEUE_SIZE events are read
+    ahead, so a slow client still applies backpressure to the agent stream.
+
+    Args:
+        events: The simplified events produced by the AgentManager; closed
+            once the stream ends or is abandoned.
+
+    Yields:
+        One or more encoded SSE records per chunk.
+
+    Raises:
+        Exception: Any exception raised by ``events``, after the buffered
+            records have been yielded.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=SSE_COALESCE_QUEUE_SIZE)
+
+    async def produce() -> None:
+        try:
+            async for event in events:
+                await queue.put(event)
+            await queue.put(_STREAM_END)
+        except Exception as e:
+            await queue.put(e)
+        finally:
+            # Unwind the source here rather than in a GC finalizer, so the
+            # agent's connections are released before the stream returns
+            await events.aclose()
+
+    loop = asyncio.get_running_loop()
+    producer = asyncio.create_task(produce())
+    buffer = bytearray()
+    deadline = 0.0
+    try:
+        while True:
+            if buffer:
+                try:
+                    item = await asyncio.wait_for(
+                        queue.get(), timeout=deadline - loop.time()
+                    )
+                except asyncio.TimeoutError:
+                    yield bytes(buffer)
+                    buffer.clear()
+                    continue
+            else:
+                item = await queue.get()
+
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                if buffer:
+                    yield bytes(buffer)
+                raise item
+
+            if not buffer:
+                deadline = loop.time() + SSE_COALESCE_WINDOW_SECONDS
+            buffer += _encode_event(item)
+            if item.get("type") != "token" or len(buffer) >= SSE_COALESCE_MAX_BYTES:
+                yield bytes(buffer)
+                buffer.clear()
+
+        if buffer:
+            yield bytes(buffer)
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
 
 
 async def message_generator(
     user_input: StreamRequest, request: Request
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """Generate a stream of messages from the agent using the simplified format.
 
     This function now uses the AgentManager to handle streaming with features like SSO authentication, tracing, and error handling.
@@ -34,7 +165,8 @@ async def message_generator(
             tokens.
 
     Yields:
-        JSON-formatted SSE messages as strings in the simplified event format.
+        JSON-formatted SSE messages as bytes in the simplified event format;
+        consecutive token events may be batched into a single chunk.
 
     Note:
         - Uses simplified event format: {"type": "message"|"token"|"error", "content": ...}
@@ -43,41 +175,28 @@ async def message_generator(
     """
     # Get token from request headers
     access_token = request.headers.get("X-Token")
-    app_logger.info(f"Received token: {'Yes' if access_token else 'No'}")
+    app_logger.debug("Received token: %s", access_token is not None)
 
     # Initialize AgentManager with SSO token
     agent_manager = AgentManager(redhat_sso_token=access_token)
 
     try:
-        app_logger.info(f"Starting stream for message: {user_input.message[:100]}...")
-
-        # Stream events using the simplified AgentManager
-        async for event in agent_manager.stream_response(user_input):
-            # Filter out duplicate human messages
-            if (
-                event.get("type") == "message"
-                and event.get("content", {}).get("type") == "human"
-                and event.get("content", {}).get("content") == user_input.message
-            ):
-                continue
+        app_logger.debug("Starting stream (len=%d)", len(user_input.message))
 
+        # Stream events using the simplified AgentManager, which drops the
+        # echo of the user's own message before it reaches this loop
+        async for chunk in _coalesce_events(
+            agent_manager.stream_response(user_input, suppress_human_echo=True)
+        ):
             # Yield the simplified event format
-            yield f"{json.dumps(event, separators=(',', ':'))}\n\n"
+            yield chunk
 
     except Exception as e:
         app_logger.error(f"Error in message generator: {e}")
-        error_event = {
-            "type": "error",
-            "content": {
-                "message": "Internal server error",
-                "recoverable": False,
-                "error_type": "stream_error",
-            },
-        }
-        yield f"{json.dumps(error_event)}\n\n"
+        yield _STREAM_ERROR_RECORD
     finally:
         # Send completion marker
-        yield "[DONE]\n\n"
+        yield _DONE_RECORD
 
 
 def _sse_response_example() -> dict[int | str, Any]:
@@ -101,9 +220,11 @@ def _sse_response_example() -> dict[int | str, Any]:
 
 
 @router.post(
-    "/v1/stream", response_class=StreamingResponse, responses=_sse_response_example()
+    "/v1/stream",
+    response_class=EventSourceResponse,
+    responses=_sse_response_example(),
 )
-async def stream(user_input: StreamRequest, request: Request) -> StreamingResponse:
+async def stream(user_input: StreamRequest, request: Request) -> EventSourceResponse:
     """Stream AI agent responses in real-time using simplified event format.
 
     This endpoint provides the core streaming functionality following the
@@ -134,18 +255,16 @@ async def stream(user_input: StreamRequest, request: Request) -> StreamingRespon
         request: FastAPI request object for extracting authentication headers.
 
     Returns:
-        StreamingResponse with simplified event format:
+        EventSourceResponse with simplified event format, interleaved with
+        periodic `: ping` keep-alive comments:
         ```
         {"type": "message", "content": {"type": "ai", "content": "Hello", "run_id": "12345", "thread_id": "thread-123", "session_id": "session-456"}}
         {"type": "token", "content": "world"}
         [DONE]
         ```
     """
-    return StreamingResponse(
-        message_generator(user_input, request),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        },
+    # Events are yielded pre-encoded as bytes, which EventSourceResponse sends
+    # unchanged, so the wire format stays the same for existing clients
+    return EventSourceResponse(
+        message_generator(user_input, request), headers=_SSE_HEADERS
     )
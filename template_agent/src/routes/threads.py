@@ -4,10 +4,15 @@ This module provides endpoints for managing conversation threads,
 including listing threads for specific users.
 """
 
-from typing import List
+from collections.abc import AsyncGenerator
+from typing import Any, List, Sequence, Tuple
 
-import psycopg2
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from psycopg import AsyncConnection, AsyncServerCursor
+from psycopg_pool import AsyncConnectionPool
+from starlette.types import Receive, Scope, Send
 
 from template_agent.src.core.storage import get_user_threads
 from template_agent.src.settings import settings
@@ -15,11 +20,111 @@ from template_agent.utils.pylogger import get_python_logger
 
 router = APIRouter()
 
-app_logger = get_python_logger(settings.PYTHON_LOG_LEVEL)
+app_logger = get_python_logger(settings.PYTHON_LOG_LEVEL, name=__name__)
 
+# Number of rows fetched per round trip from the server-side cursor
+THREADS_CURSOR_ITERSIZE = 1000
 
-@router.get("/v1/threads/{user_id}")
-async def list_threads(user_id: str) -> List[str]:
+
+async def stream_json_array(
+    rows: Sequence[Tuple[str]], cur: AsyncServerCursor, user_id: str
+) -> AsyncGenerator[bytes, None]:
+    """Stream thread IDs from a server-side cursor as a JSON array.
+
+    Rows are encoded and sent as they arrive, so memory stays bounded by the
+    cursor's itersize regardless of how many threads the user has. A failure
+    after the response has started is logged and re-raised, so the server
+    aborts the body instead of closing a truncated array.
+
+    Args:
+        rows: Rows already fetched from the cursor, sent first.
+        cur: Named (server-side) cursor with the thread query already executed.
+        user_id: The user whose threads are being streamed, used for logging.
+
+    Yields:
+        Chunks of the JSON array as bytes.
+    """
+    count = 0
+    try:
+        yield b"["
+        for row in rows:
+            if count:
+                yield b","
+            yield orjson.dumps(row[0])
+            count += 1
+        async for row in cur:
+            if count:
+                yield b","
+            yield orjson.dumps(row[0])
+            count += 1
+        yield b"]"
+        app_logger.info(f"Found {count} threads for user_id: {user_id}")
+    except Exception as e:
+        app_logger.error(
+            f"Database error after streaming {count} threads for user {user_id}: {e}"
+        )
+        raise
+
+
+async def _release_connection(
+    pool: AsyncConnectionPool, conn: AsyncConnection, cur: AsyncServerCursor | None
+) -> None:
+    """Close the cursor, end the read transaction and return conn to the pool.
+
+    Errors are logged rather than raised, so cleanup never masks the
+    exception or response that triggered it.
+    """
+    try:
+        try:
+            if cur is not None:
+                await cur.close()
+            await conn.rollback()
+        finally:
+            await pool.putconn(conn)
+    except Exception as e:
+        app_logger.error(f"Error releasing threads connection: {e}")
+
+
+class PooledCursorResponse(StreamingResponse):
+    """StreamingResponse that returns its pooled connection however it ends.
+
+    Starlette skips ``background`` tasks when the client disconnects or the
+    body raises, and an abandoned async generator only runs its ``finally``
+    once it is garbage collected, so the release happens here instead.
+    """
+
+    def __init__(
+        self,
+        content: AsyncGenerator[bytes, None],
+        pool: AsyncConnectionPool,
+        conn: AsyncConnection,
+        cur: AsyncServerCursor,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the response.
+
+        Args:
+            content: Body generator reading from ``cur``.
+            pool: Connection pool the connection was borrowed from.
+            conn: Pooled database connection owning the cursor.
+            cur: Server-side cursor the body is read from.
+            **kwargs: Passed through to ``StreamingResponse``.
+        """
+        super().__init__(content, **kwargs)
+        self._pool = pool
+        self._conn = conn
+        self._cur = cur
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send the response, then release the connection."""
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await _release_connection(self._pool, self._conn, self._cur)
+
+
+@router.get("/v1/threads/{user_id}", response_model=List[str])
+async def list_threads(user_id: str, request: Request) -> List[str] | StreamingResponse:
     """Get a list of all thread IDs for a specific user.
 
     This endpoint queries the PostgreSQL database to retrieve all unique
@@ -29,18 +134,22 @@ async def list_threads(user_id: str) -> List[str]:
 
     Args:
         user_id: The unique identifier of the user whose threads to retrieve.
+        request: The FastAPI request object, used to reach the application's
+            shared database connection pool.
 
     Returns:
-        A list of thread IDs (strings) associated with the user.
-        Returns empty list when using in-memory storage.
+        A JSON array of thread IDs (strings) associated with the user,
+        streamed from a server-side cursor. Returns the thread registry's
+        list when using in-memory storage.
 
     Raises:
         HTTPException: If there's a database connection error or query failure.
             Status code 500 with error details.
 
     Note:
-        This function uses raw SQL queries to extract thread_id from the
-        checkpoints table where metadata contains the specified user_id.
+        This function uses a parameterized SQL query to extract thread_id
+        from the checkpoints table where metadata contains the specified
+        user_id; the lookup is backed by the idx_checkpoints_user_id index.
         In-memory storage mode returns empty list as threads are not persisted.
     """
     # When using in-memory storage, get threads from thread registry
@@ -59,22 +168,37 @@ async def list_threads(user_id: str) -> List[str]:
             app_logger.error(f"Error accessing thread registry for user {user_id}: {e}")
             return []
 
+    pool: AsyncConnectionPool = request.app.state.db_pool
+    conn: AsyncConnection | None = None
+    cur: AsyncServerCursor | None = None
     try:
-        # Connect to the PostgreSQL database
-        with psycopg2.connect(settings.database_uri) as conn:
-            cur = conn.cursor()
-
-            # Query for distinct thread IDs where metadata contains the user_id
-            cur.execute(
-                f"SELECT distinct thread_id FROM checkpoints where metadata->>'user_id'='{user_id}'"
-            )
-            rows = cur.fetchall()
-            thread_ids = [row[0] for row in rows]
-
-            app_logger.info(f"Found {len(thread_ids)} threads for user_id: {user_id}")
-            return thread_ids
+        # Borrow a connection from the shared pool instead of connecting per request
+        conn = await pool.getconn()
+
+        # Named cursors are server-side, so rows are fetched in batches of
+        # itersize instead of being buffered all at once
+        cur = conn.cursor(name="threads_cur")
+        cur.itersize = THREADS_CURSOR_ITERSIZE
+
+        # Query for distinct thread IDs where metadata contains the user_id
+        await cur.execute(
+            "SELECT DISTINCT thread_id FROM checkpoints WHERE metadata->>'user_id' = %s",
+            (user_id,),
+        )
+        # Fetch the first batch up front so query errors still map to a 500
+        rows = await cur.fetchmany(THREADS_CURSOR_ITERSIZE)
+
+        return PooledCursorResponse(
+            stream_json_array(rows, cur, user_id),
+            pool,
+            conn,
+            cur,
+            media_type="application/json",
+        )
 
     except Exception as e:
+        if conn is not None:
+            await _release_connection(pool, conn, cur)
         app_logger.error(
             f"Database error while fetching threads for user {user_id}: {e}"
         )
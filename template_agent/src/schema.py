@@ -7,7 +7,7 @@ for the template agent service.
 
 from typing import Any, Literal, NotRequired
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import TypedDict
 
 
@@ -18,6 +18,9 @@ class UserInput(BaseModel):
     different endpoints in the template agent API.
     """
 
+    # Request inputs are never mutated after validation
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     message: str = Field(
         description="User input message to be processed by the agent.",
         examples=["What is 2 multiplied by 3?"],
@@ -76,6 +79,8 @@ class ChatMessage(BaseModel):
     supporting different message types and metadata.
     """
 
+    model_config = ConfigDict(extra="ignore")
+
     type: Literal["human", "ai", "tool", "custom"] = Field(
         description="The role or type of the message in the conversation.",
         examples=["human", "ai", "tool", "custom"],
@@ -5,6 +5,7 @@ BaseSettings for environment variable loading, validation, and default
 value handling for the template agent service.
 """
 
+from functools import cached_property, lru_cache
 from typing import Optional
 
 from dotenv import load_dotenv
@@ -15,7 +16,7 @@ from template_agent.src.core.exceptions.exceptions import AppException, AppExcep
 from template_agent.utils.pylogger import get_python_logger
 
 # Initialize logger
-logger = get_python_logger()
+logger = get_python_logger(name=__name__)
 
 # Load environment variables with error handling
 try:
@@ -25,6 +26,10 @@ except Exception as e:
     logger.warning(f"Could not load .env file: {e}")
 
 
+# Log levels accepted for PYTHON_LOG_LEVEL
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+
 class Settings(BaseSettings):
     """Configuration settings for the template agent.
 
@@ -70,6 +75,12 @@ class Settings(BaseSettings):
         default="pgvector", json_schema_extra={"env": "POSTGRES_HOST"}
     )
     POSTGRES_PORT: int = Field(default=5432, json_schema_extra={"env": "POSTGRES_PORT"})
+    POSTGRES_POOL_MIN_SIZE: int = Field(
+        default=4, json_schema_extra={"env": "POSTGRES_POOL_MIN_SIZE"}
+    )
+    POSTGRES_POOL_MAX_SIZE: int = Field(
+        default=20, json_schema_extra={"env": "POSTGRES_POOL_MAX_SIZE"}
+    )
 
     # Google Service Account Configuration
     GOOGLE_SERVICE_ACCOUNT_FILE: Optional[str] = Field(
@@ -118,13 +129,14 @@ class Settings(BaseSettings):
         json_schema_extra={"env": "GOOGLE_APPLICATION_CREDENTIALS_CONTENT"},
     )
 
-    @property
+    @cached_property
     def database_uri(self) -> str:
         """Generate database URI from individual components.
 
         Constructs a PostgreSQL connection URI using the configured
         database settings including user, password, host, port, and
-        database name.
+        database name. The URI is built on first access and cached on
+        the instance.
 
         Returns:
             The complete PostgreSQL database URI string.
@@ -156,8 +168,9 @@ def validate_config(settings: Settings) -> None:
         )
 
     # Validate log level
-    valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-    if settings.PYTHON_LOG_LEVEL.upper() not in valid_log_levels:
+    log_level = settings.PYTHON_LOG_LEVEL.upper()
+    if log_level not in _VALID_LOG_LEVELS:
+        valid_log_levels = sorted(_VALID_LOG_LEVELS)
         logger.error(
             f"PYTHON_LOG_LEVEL must be one of {valid_log_levels}, got {settings.PYTHON_LOG_LEVEL}"
         )
@@ -167,5 +180,18 @@ def validate_config(settings: Settings) -> None:
         )
 
 
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Get the cached application settings.
+
+    The environment is parsed once on first call; later calls return the
+    same instance, which is also exposed as the module-level ``settings``.
+
+    Returns:
+        The shared Settings instance.
+    """
+    return Settings()
+
+
 # Create settings instance without validation (validation happens in main.py)
-settings = Settings()
+settings = get_settings()
@@ -6,97 +6,117 @@ credential formats including base64-encoded, file paths, and direct JSON content
 
 import base64
 import os
-import tempfile
+from typing import Optional
+
+import orjson
+from google.oauth2 import service_account
 
 from template_agent.src.settings import settings
 from template_agent.utils.pylogger import get_python_logger
 
-logger = get_python_logger()
+logger = get_python_logger(settings.PYTHON_LOG_LEVEL, name=__name__)
 
+# Longest value still treated as a credentials file path
+_MAX_CREDENTIALS_PATH_LENGTH = 4096
 
-def initialize_google_genai():
-    """Initialize Google Generative AI with service account credentials."""
-    credentials_file = None
+# Byte order mark some editors prepend to pasted or exported JSON
+_BOM = "\ufeff"
+
+# Service account credentials loaded in memory by initialize_google_genai
+_google_credentials: Optional[service_account.Credentials] = None
+
+
+def get_google_credentials() -> Optional[service_account.Credentials]:
+    """Get the in-memory Google service account credentials.
+
+    These credentials are only visible to callers that pass them explicitly,
+    such as the agent's ChatGoogleGenerativeAI model. GOOGLE_APPLICATION_CREDENTIALS
+    is not set for them, so other google-auth clients relying on Application
+    Default Credentials will not pick them up.
+
+    Returns:
+        The credentials loaded by initialize_google_genai from base64-encoded
+        or direct JSON content, or None if credentials were not provided that
+        way (e.g. a file path exported as GOOGLE_APPLICATION_CREDENTIALS).
+    """
+    return _google_credentials
+
+
+def _decode_base64_json(value: str) -> Optional[bytes]:
+    """Decode base64 content that wraps a JSON object.
+
+    Args:
+        value: Candidate base64 string; embedded line breaks are ignored.
 
-    if not settings.GOOGLE_APPLICATION_CREDENTIALS_CONTENT:
+    Returns:
+        The decoded JSON bytes, or None if the value is not base64 or does
+        not decode to something starting with "{".
+    """
+    try:
+        decoded = base64.b64decode("".join(value.split()), validate=True)
+    except ValueError:
+        return None
+    decoded = decoded.strip().removeprefix(_BOM.encode()).lstrip()
+    return decoded if decoded[:1] == b"{" else None
+
+
+def initialize_google_genai():
+    """Initialize Google Generative AI with service account credentials.
+
+    The configured content is classified in a single pass: direct JSON
+    (starts with "{"), base64-encoded JSON (decodes to a JSON object), or
+    otherwise a file path. Surrounding whitespace and a UTF-8 byte order mark
+    are ignored. Path lookups are skipped for values too long to be a path so
+    pasted credentials never hit the filesystem, and JSON content is parsed
+    exactly once. The content itself is never logged.
+
+    Only a file path is exported as GOOGLE_APPLICATION_CREDENTIALS; base64 and
+    JSON content are kept in memory and exposed via get_google_credentials.
+    """
+    global _google_credentials
+
+    raw = settings.GOOGLE_APPLICATION_CREDENTIALS_CONTENT
+    if not raw:
         logger.warning("No Google service account credentials configured")
         return
 
-    # Check if credentials are provided as base64-encoded environment variable
-    if settings.GOOGLE_APPLICATION_CREDENTIALS_CONTENT.startswith("ewog"):
-        # Validate that it's valid JSON
-        import json
-
-        try:
-            # Decode base64 credentials
-            credentials_json = base64.b64decode(
-                settings.GOOGLE_APPLICATION_CREDENTIALS_CONTENT
-            ).decode("utf-8")
-
-            json.loads(credentials_json)  # This will raise an exception if invalid JSON
-
-            # Create temporary file with credentials
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
-            ) as temp_file:
-                temp_file.write(credentials_json)
-                credentials_file = temp_file.name
-
-            logger.info(
-                "Initialized Google Generative AI with base64-encoded service account credentials"
-            )
-
-        except (base64.binascii.Error, UnicodeDecodeError) as e:
-            logger.error(f"Failed to decode base64 credentials: {e}")
-            return
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in base64 credentials: {e}")
-            return
-        except Exception as e:
-            logger.error(f"Unexpected error processing base64 credentials: {e}")
-            return
-
-    # Check if credentials are provided as file path
-    elif os.path.exists(settings.GOOGLE_APPLICATION_CREDENTIALS_CONTENT):
-        credentials_file = settings.GOOGLE_APPLICATION_CREDENTIALS_CONTENT
+    value = raw.strip().lstrip(_BOM).lstrip()
+
+    payload: str | bytes
+    if value[:1] == "{":
+        # Credentials provided as direct JSON content
+        source = "direct JSON"
+        payload = value
+    elif (decoded := _decode_base64_json(value)) is not None:
+        # Credentials provided as base64-encoded JSON
+        source = "base64-encoded"
+        payload = decoded
+    elif len(value) < _MAX_CREDENTIALS_PATH_LENGTH and os.path.exists(value):
+        # Credentials provided as file path for langchain-google-genai to use
+        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = value
         logger.info(
-            f"Initialized Google Generative AI with service account file: {settings.GOOGLE_SERVICE_ACCOUNT_FILE}"
+            f"Initialized Google Generative AI with service account file: {value}"
         )
-
-    # Check if credentials are provided as direct JSON content
-    elif settings.GOOGLE_APPLICATION_CREDENTIALS_CONTENT.strip().startswith("{"):
-        # Validate that it's valid JSON
-        import json
-
-        try:
-            credentials_json = settings.GOOGLE_APPLICATION_CREDENTIALS_CONTENT.strip()
-            json.loads(credentials_json)  # This will raise an exception if invalid JSON
-
-            # Create temporary file with credentials
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
-            ) as temp_file:
-                temp_file.write(credentials_json)
-                credentials_file = temp_file.name
-
-            logger.info(
-                "Initialized Google Generative AI with direct JSON service account credentials"
-            )
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in direct credentials: {e}")
-            return
-        except Exception as e:
-            logger.error(f"Unexpected error processing direct JSON credentials: {e}")
-            return
-
+        logger.debug(f"Set GOOGLE_APPLICATION_CREDENTIALS to: {value}")
+        return
     else:
         logger.warning(
-            f"Google service account credentials not found or invalid format: {settings.GOOGLE_SERVICE_ACCOUNT_FILE[:50]}..."
+            "Google service account credentials not found or invalid format "
+            f"({len(value)} characters; not JSON, base64 JSON or an existing path)"
         )
         return
 
-    # Set environment variable for langchain-google-genai to use
-    if credentials_file:
-        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_file
-        logger.debug(f"Set GOOGLE_APPLICATION_CREDENTIALS to: {credentials_file}")
+    try:
+        _google_credentials = service_account.Credentials.from_service_account_info(
+            orjson.loads(payload)
+        )
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Invalid JSON in {source} credentials: {e}")
+        return
+    except Exception as e:
+        logger.error(f"Unexpected error processing {source} credentials: {e}")
+        return
+
+    logger.info(
+        f"Initialized Google Generative AI with {source} service account credentials"
+    )
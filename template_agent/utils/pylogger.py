@@ -1,69 +1,84 @@
 """Structured logger utility for the Template MCP server."""
 
+import functools
 import logging
-import sys
-from typing import Any, Dict, List, Set
+import logging.config
+import threading
+import time
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
+import orjson
 import structlog
+from structlog.typing import FilteringBoundLogger
 
 # HTTP clients
-HTTP_CLIENT_LOGGERS = {
-    "urllib3",
-    "urllib3.connectionpool",
-    "urllib3.util",
-    "urllib3.util.retry",
-    "requests",
-    "httpx",
-}
+HTTP_CLIENT_LOGGERS = frozenset(
+    {
+        "urllib3",
+        "urllib3.connectionpool",
+        "urllib3.util",
+        "urllib3.util.retry",
+        "requests",
+        "httpx",
+    }
+)
 
 # AWS SDK
-AWS_LOGGERS = {
-    "botocore",
-    "botocore.client",
-    "botocore.credentials",
-    "botocore.httpsession",
-    "boto3",
-    "boto3.resources",
-}
+AWS_LOGGERS = frozenset(
+    {
+        "botocore",
+        "botocore.client",
+        "botocore.credentials",
+        "botocore.httpsession",
+        "boto3",
+        "boto3.resources",
+    }
+)
 
 # MCP (custom platform)
-MCP_LOGGERS = {
-    "fastmcp",
-    "fastmcp.server",
-    "fastmcp.server.http",
-    "fastmcp.utilities",
-    "fastmcp.utilities.logging",
-    "fastmcp.client",
-    "fastmcp.transports",
-}
+MCP_LOGGERS = frozenset(
+    {
+        "fastmcp",
+        "fastmcp.server",
+        "fastmcp.server.http",
+        "fastmcp.utilities",
+        "fastmcp.utilities.logging",
+        "fastmcp.client",
+        "fastmcp.transports",
+    }
+)
 
 # ML/AI frameworks
-ML_AI_LOGGERS = {
-    "sentence_transformers",
-    "transformers",
-    "transformers.models",
-    "transformers.tokenization_utils",
-    "transformers.tokenization_utils_base",
-    "transformers.configuration_utils",
-    "transformers.modeling_utils",
-    "huggingface_hub",
-    "huggingface_hub.utils",
-    "langchain_huggingface",
-    "torch",
-    "torch.nn",
-}
+ML_AI_LOGGERS = frozenset(
+    {
+        "sentence_transformers",
+        "transformers",
+        "transformers.models",
+        "transformers.tokenization_utils",
+        "transformers.tokenization_utils_base",
+        "transformers.configuration_utils",
+        "transformers.modeling_utils",
+        "huggingface_hub",
+        "huggingface_hub.utils",
+        "langchain_huggingface",
+        "torch",
+        "torch.nn",
+    }
+)
 
 # Observability / telemetry
-OBSERVABILITY_LOGGERS = {
-    "langfuse",
-    "langfuse.client",
-    "langfuse.api",
-    "langfuse.callback",
-}
+OBSERVABILITY_LOGGERS = frozenset(
+    {
+        "langfuse",
+        "langfuse.client",
+        "langfuse.api",
+        "langfuse.callback",
+    }
+)
 
 # --- Aggregated Sets ---
 
-THIRD_PARTY_LOGGERS: Set[str] = (
+THIRD_PARTY_LOGGERS: FrozenSet[str] = (
     HTTP_CLIENT_LOGGERS
     | AWS_LOGGERS
     | MCP_LOGGERS
@@ -71,32 +86,227 @@ THIRD_PARTY_LOGGERS: Set[str] = (
     | OBSERVABILITY_LOGGERS
 )
 
-ERROR_ONLY_LOGGERS: Set[str] = ML_AI_LOGGERS | OBSERVABILITY_LOGGERS
+ERROR_ONLY_LOGGERS: FrozenSet[str] = ML_AI_LOGGERS | OBSERVABILITY_LOGGERS
 
-_LOGGING_CONFIGURED = False
+# --- Static uvicorn config pieces, computed once at import ---
 
+_THIRD_PARTY_NON_ERROR: Tuple[str, ...] = tuple(
+    THIRD_PARTY_LOGGERS - ERROR_ONLY_LOGGERS
+)
+_ERROR_ONLY_TUPLE: Tuple[str, ...] = tuple(ERROR_ONLY_LOGGERS)
+
+# Base uvicorn loggers
+_UVICORN_BASE_LOGGERS: Tuple[str, ...] = (
+    "",
+    "uvicorn",
+    "uvicorn.error",
+    "uvicorn.asgi",
+    "uvicorn.protocols",
+)
+_UVICORN_ACCESS_LOGGERS: Tuple[str, ...] = ("uvicorn.access",)
 
-# --- Internal helpers ---
+# Entry shared by every uvicorn-config logger; "level" is filled in per config
+_UVICORN_LOGGER_TEMPLATE: Dict[str, Any] = {
+    "handlers": ("default",),
+    "level": None,
+    "propagate": False,
+}
 
+# Level last applied by get_python_logger; None until logging is configured
+_CONFIGURED_LEVEL: Optional[str] = None
+# Threshold read by _fast_level_filter; updated whenever the level changes
+_LEVEL_INT = logging.INFO
+# structlog method names mapped to stdlib level numbers
+_METHOD_LEVELS: Dict[str, int] = {
+    **{name.lower(): level for name, level in logging.getLevelNamesMapping().items()},
+    "exception": logging.ERROR,
+}
 
-def _clear_handlers(logger: logging.Logger) -> None:
-    logger.handlers.clear()
-    logger.filters.clear()
 
+# --- Internal helpers ---
 
-def _setup_logger(logger_name: str, level: str) -> None:
-    logger = logging.getLogger(logger_name)
-    _clear_handlers(logger)
-    logger.setLevel(logging.ERROR if logger_name in ERROR_ONLY_LOGGERS else level)
-    logger.propagate = True
 
+def _fast_level_filter(
+    logger: Any, method_name: str, event_dict: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Drop events below the configured level before any other processor runs."""
+    if _METHOD_LEVELS.get(method_name, logging.INFO) < _LEVEL_INT:
+        raise structlog.DropEvent
+    return event_dict
+
+
+# --- Handlers ---
+
+# Characters of formatted records held before a batched write
+LOG_BUFFER_SIZE = 8192
+# Oldest a buffered record may get before it is written, even when idle
+LOG_BUFFER_MAX_AGE_SECONDS = 1.0
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that batches formatted records into fewer writes.
+
+    Records are written as one chunk once the buffer reaches ``buffer_size``,
+    once the oldest pending record is older than ``max_age`` seconds, or
+    immediately for ERROR and above so nothing is lost before a crash. A
+    daemon thread also flushes every ``max_age`` seconds, so an idle process
+    does not hold records back until the next one arrives. ``close`` (called
+    by ``logging.shutdown`` at exit) stops the thread and writes the rest.
+    """
+
+    def __init__(
+        self,
+        stream: Any = None,
+        buffer_size: int = LOG_BUFFER_SIZE,
+        max_age: float = LOG_BUFFER_MAX_AGE_SECONDS,
+    ) -> None:
+        """Initialize the handler and start its flush thread.
+
+        Args:
+            stream: Stream to write to; defaults to ``sys.stderr``.
+            buffer_size: Characters buffered before a batch is written.
+            max_age: Seconds a pending batch may wait before it is written;
+                0 writes every record immediately and starts no thread.
+        """
+        super().__init__(stream)
+        self.buffer_size = buffer_size
+        self.max_age = max_age
+        self._pending: List[str] = []
+        self._pending_size = 0
+        self._pending_since = 0.0
+        # Not "_closed", which logging.Handler.close sets to True
+        self._stop_flush = threading.Event()
+        if max_age > 0:
+            threading.Thread(
+                target=self._flush_periodically,
+                name=f"{type(self).__name__}-flush",
+                daemon=True,
+            ).start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer a formatted record, writing the batch when it is due."""
+        try:
+            msg = self.format(record) + self.terminator
+            now = time.monotonic()
+            if not self._pending:
+                self._pending_since = now
+            self._pending.append(msg)
+            self._pending_size += len(msg)
+            if (
+                record.levelno >= logging.ERROR
+                or self._pending_size >= self.buffer_size
+                or now - self._pending_since >= self.max_age
+            ):
+                self._write_pending()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write any buffered records and flush the stream."""
+        self.acquire()
+        try:
+            self._write_pending()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Stop the flush thread, write any buffered records and close.
+
+        Safe to call more than once, as ``logging.shutdown`` does for
+        handlers that ``dictConfig`` already closed.
+        """
+        # Not joined: logging.shutdown calls close while holding the handler
+        # lock, which the flush thread may be waiting on
+        if not self._stop_flush.is_set():
+            self._stop_flush.set()
+            self.flush()
+        super().close()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_flush.wait(self.max_age):
+            if self._pending:
+                try:
+                    self.flush()
+                except (OSError, ValueError):
+                    # The stream was closed underneath the handler
+                    return
+
+    def _write_pending(self) -> None:
+        if self._pending:
+            self.stream.write("".join(self._pending))
+            self._pending.clear()
+            self._pending_size = 0
+        if self.stream and hasattr(self.stream, "flush"):
+            self.stream.flush()
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> bytes:
+    """Serialize a structlog event dict with orjson, returning bytes."""
+    return orjson.dumps(obj, default=str)
+
+
+def _orjson_dumps_str(obj: Any, **kwargs: Any) -> str:
+    """Serialize a structlog event dict with orjson for stdlib formatters."""
+    return orjson.dumps(obj, default=str).decode()
+
+
+# --- Processor chains, instantiated once at import ---
+
+# Chain for application events rendered by structlog itself
+_STRUCTLOG_PROCESSORS: Tuple[Any, ...] = (
+    _fast_level_filter,
+    structlog.processors.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+    structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+)
 
-def _configure_third_party_loggers(log_level: str) -> None:
-    """Apply structured logging to selected third-party loggers."""
-    logging.getLogger().handlers.clear()
+# Chain applied to stdlib records before the formatter renders them
+_FOREIGN_PRE_CHAIN: Tuple[Any, ...] = (
+    structlog.stdlib.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+)
 
-    for name in THIRD_PARTY_LOGGERS:
-        _setup_logger(name, log_level)
+# Formatter used for stdlib (uvicorn and third-party) records
+_DEFAULT_FORMATTER: Dict[str, Any] = {
+    "()": "structlog.stdlib.ProcessorFormatter",
+    "processor": structlog.processors.JSONRenderer(serializer=_orjson_dumps_str),
+    "foreign_pre_chain": _FOREIGN_PRE_CHAIN,
+}
+
+
+def _base_dict_config(log_level: str) -> Dict[str, Any]:
+    """Build the stdlib config for the root and third-party loggers."""
+    return {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {"default": dict(_DEFAULT_FORMATTER)},
+        "handlers": {
+            "default": {
+                "formatter": "default",
+                "class": "template_agent.utils.pylogger.BufferedStreamHandler",
+                "stream": "ext://sys.stdout",
+            },
+        },
+        "root": {"handlers": ("default",), "level": log_level},
+        "loggers": {
+            **dict.fromkeys(
+                _THIRD_PARTY_NON_ERROR,
+                {"handlers": (), "level": log_level, "propagate": True},
+            ),
+            **dict.fromkeys(
+                _ERROR_ONLY_TUPLE,
+                {"handlers": (), "level": "ERROR", "propagate": True},
+            ),
+        },
+    }
 
 
 # --- Public API ---
@@ -104,101 +314,113 @@ def _configure_third_party_loggers(log_level: str) -> None:
 
 def force_reconfigure_all_loggers(log_level: str = "INFO") -> None:
     """Force logger reconfiguration, even if already initialized."""
-    global _LOGGING_CONFIGURED
-    _LOGGING_CONFIGURED = False
+    global _CONFIGURED_LEVEL
+    _CONFIGURED_LEVEL = None
+    _get_logger.cache_clear()
     get_python_logger(log_level)
 
 
-def get_python_logger(log_level: str = "INFO") -> structlog.BoundLogger:
-    """Get a configured structlog logger."""
-    global _LOGGING_CONFIGURED
-    log_level = log_level.upper()
+def get_python_logger(
+    log_level: Optional[str] = None, name: Optional[str] = None
+) -> FilteringBoundLogger:
+    """Get a configured structlog logger.
 
-    if not _LOGGING_CONFIGURED:
-        logging.basicConfig(
-            format="%(message)s",
-            stream=sys.stdout,
-            level=log_level,
-        )
+    Application events bypass the stdlib logging module: they are filtered
+    by level before any other processor, rendered with orjson and written as
+    bytes straight to stdout. The level is checked on every event, so a call
+    with a new level also applies to loggers handed out earlier.
+
+    Args:
+        log_level: Level to apply; None keeps the current one (INFO if
+            logging is not configured yet).
+        name: Name bound to every event as ``logger``; callers pass
+            ``__name__``.
+
+    Returns:
+        The configured logger, cached per name.
+    """
+    if log_level is None:
+        log_level = _CONFIGURED_LEVEL or "INFO"
+    else:
+        log_level = log_level.upper()
+    if log_level != _CONFIGURED_LEVEL:
+        _configure_logging(log_level)
+    return _get_logger(name)
+
+
+def _configure_logging(log_level: str) -> None:
+    """Configure logging on first use, or only move the level afterwards."""
+    global _CONFIGURED_LEVEL, _LEVEL_INT
+
+    _LEVEL_INT = logging.getLevelName(log_level)
+
+    if _CONFIGURED_LEVEL is None:
+        logging.config.dictConfig(_base_dict_config(log_level))
 
         structlog.configure(
-            processors=[
-                structlog.stdlib.filter_by_level,
-                structlog.stdlib.add_logger_name,
-                structlog.stdlib.add_log_level,
-                structlog.stdlib.PositionalArgumentsFormatter(),
-                structlog.processors.TimeStamper(fmt="iso"),
-                structlog.processors.StackInfoRenderer(),
-                structlog.processors.format_exc_info,
-                structlog.processors.UnicodeDecoder(),
-                structlog.processors.JSONRenderer(),
-            ],
+            # A list, as structlog.testing.capture_logs edits it in place
+            processors=list(_STRUCTLOG_PROCESSORS),
             context_class=dict,
-            logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
+            logger_factory=structlog.BytesLoggerFactory(),
+            # Filtering happens in _fast_level_filter so that loggers bound
+            # before a level change pick up the new level
+            wrapper_class=structlog.make_filtering_bound_logger(logging.NOTSET),
             cache_logger_on_first_use=True,
         )
+    else:
+        logging.getLogger().setLevel(log_level)
+        for name in _THIRD_PARTY_NON_ERROR:
+            logging.getLogger(name).setLevel(log_level)
+
+    _CONFIGURED_LEVEL = log_level
 
-        _LOGGING_CONFIGURED = True
 
-    _configure_third_party_loggers(log_level)
-    return structlog.get_logger()
+@functools.lru_cache(maxsize=None)
+def _get_logger(name: Optional[str]) -> FilteringBoundLogger:
+    """Return a logger with ``name`` bound, cached per module."""
+    logger = structlog.get_logger()
+    return logger if name is None else logger.bind(logger=name)
 
 
 def get_uvicorn_log_config(log_level: str = "INFO") -> Dict[str, Any]:
-    """Return a Uvicorn-compatible logging config that integrates with structlog."""
-    log_level = log_level.upper()
-    default_formatter = {
-        "()": "structlog.stdlib.ProcessorFormatter",
-        "processor": structlog.processors.JSONRenderer(),
-        "foreign_pre_chain": [
-            structlog.stdlib.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-        ],
-    }
+    """Return a Uvicorn-compatible logging config that integrates with structlog.
+
+    The config is built once per log level and cached, so callers receive a
+    shared dict that must not be mutated.
+    """
+    return _build_uvicorn_log_config(log_level.upper())
 
-    def make_logger_config(names: List[str], level: str) -> Dict[str, Any]:
-        return {
-            name: {
-                "handlers": ["default"],
-                "level": level,
-                "propagate": False,
-            }
-            for name in names
-        }
 
-    # Base uvicorn loggers
-    base_loggers = ["", "uvicorn", "uvicorn.error", "uvicorn.asgi", "uvicorn.protocols"]
-    access_loggers = ["uvicorn.access"]
+@functools.lru_cache(maxsize=4)
+def _build_uvicorn_log_config(log_level: str) -> Dict[str, Any]:
+    def make_logger_config(names: Tuple[str, ...], level: str) -> Dict[str, Any]:
+        # dictConfig only reads logger entries, so every name shares one dict
+        return dict.fromkeys(names, {**_UVICORN_LOGGER_TEMPLATE, "level": level})
 
     return {
         "version": 1,
         "disable_existing_loggers": False,
         "formatters": {
-            "default": default_formatter,
-            "access": default_formatter,
+            # Separate copies, since uvicorn may set use_colors on each
+            "default": dict(_DEFAULT_FORMATTER),
+            "access": dict(_DEFAULT_FORMATTER),
         },
         "handlers": {
             "default": {
                 "formatter": "default",
-                "class": "logging.StreamHandler",
+                "class": "template_agent.utils.pylogger.BufferedStreamHandler",
                 "stream": "ext://sys.stdout",
             },
             "access": {
                 "formatter": "access",
-                "class": "logging.StreamHandler",
+                "class": "template_agent.utils.pylogger.BufferedStreamHandler",
                 "stream": "ext://sys.stdout",
             },
         },
         "loggers": {
-            **make_logger_config(base_loggers, log_level),
-            **make_logger_config(access_loggers, log_level),
-            **make_logger_config(
-                list(THIRD_PARTY_LOGGERS - ERROR_ONLY_LOGGERS), log_level
-            ),
-            **make_logger_config(list(ERROR_ONLY_LOGGERS), "ERROR"),
+            **make_logger_config(_UVICORN_BASE_LOGGERS, log_level),
+            **make_logger_config(_UVICORN_ACCESS_LOGGERS, log_level),
+            **make_logger_config(_THIRD_PARTY_NON_ERROR, log_level),
+            **make_logger_config(_ERROR_ONLY_TUPLE, "ERROR"),
         },
     }
@@ -0,0 +1,23 @@
+"""Shared fixtures for the template agent tests."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="module")
+def client(request):
+    """Build a test app for the module's ``router`` and share its client."""
+    app = FastAPI()
+    app.include_router(request.module.router)
+    return TestClient(app)
+
+
+@pytest.fixture
+def collect():
+    """Return a helper collecting every chunk produced by an async generator."""
+
+    async def _collect(generator):
+        return [chunk async for chunk in generator]
+
+    return _collect
@@ -0,0 +1,105 @@
+"""Tests for the agent module."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from template_agent.src.core import agent
+from template_agent.src.core.agent import (
+    CHECKPOINTS_INDEX_BUILD_IN_PROGRESS_SQL,
+    CHECKPOINTS_USER_ID_INDEX_SQL,
+    CHECKPOINTS_USER_ID_INDEX_VALID_SQL,
+    ensure_checkpoints_user_id_index,
+)
+
+
+class _FakeConnection:
+    """Autocommit connection stand-in answering queries from a script."""
+
+    def __init__(self, locked=True, valid=None, building=False):
+        self.answers = {
+            "SELECT pg_try_advisory_lock(%s)": locked,
+            CHECKPOINTS_USER_ID_INDEX_VALID_SQL: valid,
+            CHECKPOINTS_INDEX_BUILD_IN_PROGRESS_SQL: building,
+        }
+        self.executed = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, query, params=None):
+        self.executed.append(query)
+        answer = self.answers.get(query)
+        return AsyncMock(fetchone=AsyncMock(return_value=(answer,)))
+
+
+@pytest.fixture
+def connect(monkeypatch):
+    """Return a factory installing a fake connection for the index helper."""
+
+    def _connect(**answers):
+        conn = _FakeConnection(**answers)
+        monkeypatch.setattr(
+            agent.AsyncConnection, "connect", AsyncMock(return_value=conn)
+        )
+        return conn
+
+    return _connect
+
+
+def _ddl(conn):
+    """Return the DDL statements the helper ran."""
+    return [q for q in conn.executed if q.startswith(("CREATE", "DROP"))]
+
+
+class TestEnsureCheckpointsUserIdIndex:
+    """Test cases for the one-time checkpoints index build."""
+
+    @pytest.mark.asyncio
+    async def test_missing_index_is_created(self, connect):
+        """Test the index is built when it does not exist yet."""
+        conn = connect(valid=None)
+
+        await ensure_checkpoints_user_id_index()
+
+        assert _ddl(conn) == [CHECKPOINTS_USER_ID_INDEX_SQL]
+
+    @pytest.mark.asyncio
+    async def test_valid_index_is_left_alone(self, connect):
+        """Test a valid index is not touched."""
+        conn = connect(valid=True)
+
+        await ensure_checkpoints_user_id_index()
+
+        assert _ddl(conn) == []
+
+    @pytest.mark.asyncio
+    async def test_invalid_index_is_rebuilt(self, connect):
+        """Test an index left invalid by a failed build is dropped and rebuilt."""
+        conn = connect(valid=False)
+
+        await ensure_checkpoints_user_id_index()
+
+        assert _ddl(conn)[0].startswith("DROP INDEX CONCURRENTLY")
+        assert _ddl(conn)[1] == CHECKPOINTS_USER_ID_INDEX_SQL
+
+    @pytest.mark.asyncio
+    async def test_index_being_built_is_not_dropped(self, connect):
+        """Test an index still being built elsewhere is left to finish."""
+        conn = connect(valid=False, building=True)
+
+        await ensure_checkpoints_user_id_index()
+
+        assert _ddl(conn) == []
+
+    @pytest.mark.asyncio
+    async def test_skips_when_another_replica_holds_the_lock(self, connect):
+        """Test nothing is checked or built without the advisory lock."""
+        conn = connect(locked=False, valid=False)
+
+        await ensure_checkpoints_user_id_index()
+
+        assert conn.executed == ["SELECT pg_try_advisory_lock(%s)"]
@@ -1,8 +1,9 @@
 """Tests for the agent_utils module."""
 
-from unittest.mock import Mock
-
 import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.messages import ChatMessage as LangchainChatMessage
+from pydantic import ValidationError
 
 from template_agent.src.core.agent_utils import (
     convert_message_content_to_string,
@@ -12,6 +13,10 @@ from template_agent.src.core.agent_utils import (
 from template_agent.src.schema import ChatMessage
 
 
+class UnsupportedMessage:
+    """Stand-in for a message type the converter does not handle."""
+
+
 class TestAgentUtils:
     """Test cases for agent utility functions."""
 
@@ -59,8 +64,6 @@ class TestAgentUtils:
 
     def test_langchain_to_chat_message_human(self):
         """Test converting HumanMessage to ChatMessage."""
-        from langchain_core.messages import HumanMessage
-
         human_msg = HumanMessage(content="Hello")
         result = langchain_to_chat_message(human_msg)
 
@@ -68,10 +71,15 @@ class TestAgentUtils:
         assert result.type == "human"
         assert result.content == "Hello"
 
+    def test_langchain_to_chat_message_custom_is_validated(self):
+        """Test custom messages still go through ChatMessage validation."""
+        custom_msg = LangchainChatMessage(content=["not a dict"], role="custom")
+
+        with pytest.raises(ValidationError):
+            langchain_to_chat_message(custom_msg)
+
     def test_langchain_to_chat_message_ai(self):
         """Test converting AIMessage to ChatMessage."""
-        from langchain_core.messages import AIMessage
-
         ai_msg = AIMessage(content="Hello", tool_calls=[])
         result = langchain_to_chat_message(ai_msg)
 
@@ -81,8 +89,6 @@ class TestAgentUtils:
 
     def test_langchain_to_chat_message_tool(self):
         """Test converting ToolMessage to ChatMessage."""
-        from langchain_core.messages import ToolMessage
-
         tool_msg = ToolMessage(content="Tool result", tool_call_id="call_123")
         result = langchain_to_chat_message(tool_msg)
 
@@ -93,8 +99,7 @@ class TestAgentUtils:
 
     def test_langchain_to_chat_message_unsupported(self):
         """Test that unsupported message types raise ValueError."""
-        mock_msg = Mock()
-        mock_msg.__class__.__name__ = "UnsupportedMessage"
+        mock_msg = UnsupportedMessage()
 
         with pytest.raises(ValueError, match="Unsupported message type"):
             langchain_to_chat_message(mock_msg)
@@ -1,27 +1,21 @@
 """Tests for the feedback route."""
 
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
-from fastapi.testclient import TestClient
-
-from template_agent.src.routes.feedback import router
+# Mounted by the shared client fixture in conftest.py
+from template_agent.src.routes.feedback import router as router
 from template_agent.src.schema import FeedbackRequest
 
 
 class TestFeedbackRoute:
     """Test cases for feedback endpoint."""
 
-    @patch("template_agent.src.routes.feedback.client")
-    def test_feedback_endpoint_success(self, mock_client):
+    def test_feedback_endpoint_success(self, client, monkeypatch):
         """Test feedback endpoint with successful Langfuse call."""
-        from fastapi import FastAPI
-
-        app = FastAPI()
-        app.include_router(router)
-        client = TestClient(app)
-
         # Mock the Langfuse client
-        mock_client.score.return_value = None
+        mock_client = SimpleNamespace(score=Mock(return_value=None))
+        monkeypatch.setattr("template_agent.src.routes.feedback.client", mock_client)
 
         feedback_data = {
             "run_id": "run_123",
@@ -44,17 +38,11 @@ class TestFeedbackRoute:
             comment="Great response",
         )
 
-    @patch("template_agent.src.routes.feedback.client")
-    def test_feedback_endpoint_minimal_data(self, mock_client):
+    def test_feedback_endpoint_minimal_data(self, client, monkeypatch):
         """Test feedback endpoint with minimal required data."""
-        from fastapi import FastAPI
-
-        app = FastAPI()
-        app.include_router(router)
-        client = TestClient(app)
-
         # Mock the Langfuse client
-        mock_client.score.return_value = None
+        mock_client = SimpleNamespace(score=Mock(return_value=None))
+        monkeypatch.setattr("template_agent.src.routes.feedback.client", mock_client)
 
         feedback_data = {"run_id": "run_123", "key": "response_quality", "score": 4.5}
 
@@ -0,0 +1,141 @@
+"""Tests for the Google credentials module."""
+
+import base64
+from unittest.mock import Mock
+
+import orjson
+import pytest
+import structlog
+from structlog.testing import capture_logs
+
+from template_agent.utils import google_creds
+from template_agent.utils.google_creds import (
+    get_google_credentials,
+    initialize_google_genai,
+)
+
+SERVICE_ACCOUNT_INFO = {"type": "service_account", "project_id": "test-project"}
+SERVICE_ACCOUNT_JSON = orjson.dumps(SERVICE_ACCOUNT_INFO, option=orjson.OPT_INDENT_2)
+
+
+@pytest.fixture(autouse=True)
+def from_info(monkeypatch):
+    """Reset loaded credentials and stub out service account parsing."""
+    monkeypatch.setattr(google_creds, "_google_credentials", None)
+    monkeypatch.delenv("GOOGLE_APPLICATION_CREDENTIALS", raising=False)
+    mock = Mock(return_value="credentials")
+    monkeypatch.setattr(
+        google_creds.service_account.Credentials, "from_service_account_info", mock
+    )
+    return mock
+
+
+@pytest.fixture
+def set_content(monkeypatch):
+    """Return a setter for the configured credentials content."""
+
+    def _set(value):
+        monkeypatch.setattr(
+            google_creds.settings, "GOOGLE_APPLICATION_CREDENTIALS_CONTENT", value
+        )
+
+    return _set
+
+
+class TestInitializeGoogleGenai:
+    """Test cases for classifying the configured credentials content."""
+
+    def test_base64_content_is_loaded_in_memory(self, set_content, from_info):
+        """Test base64-encoded JSON is decoded and parsed."""
+        set_content(base64.b64encode(SERVICE_ACCOUNT_JSON).decode())
+
+        initialize_google_genai()
+
+        from_info.assert_called_once_with(SERVICE_ACCOUNT_INFO)
+        assert get_google_credentials() == "credentials"
+
+    def test_compact_base64_content_is_loaded(self, set_content, from_info):
+        """Test base64 of compact JSON ("eyJ...") is recognised too."""
+        set_content(base64.b64encode(orjson.dumps(SERVICE_ACCOUNT_INFO)).decode())
+
+        initialize_google_genai()
+
+        from_info.assert_called_once_with(SERVICE_ACCOUNT_INFO)
+
+    def test_wrapped_base64_content_is_loaded(self, set_content, from_info):
+        """Test line-wrapped base64 output is accepted."""
+        encoded = base64.b64encode(SERVICE_ACCOUNT_JSON).decode()
+        set_content("\n".join(encoded[i : i + 76] for i in range(0, len(encoded), 76)))
+
+        initialize_google_genai()
+
+        from_info.assert_called_once_with(SERVICE_ACCOUNT_INFO)
+
+    def test_json_with_bom_and_whitespace_is_loaded(self, set_content, from_info):
+        """Test a byte order mark and surrounding whitespace are ignored."""
+        set_content("\n\ufeff  " + SERVICE_ACCOUNT_JSON.decode() + "\n")
+
+        initialize_google_genai()
+
+        from_info.assert_called_once_with(SERVICE_ACCOUNT_INFO)
+
+    def test_json_content_is_loaded_in_memory(self, set_content, from_info):
+        """Test direct JSON is parsed without exporting a credentials path."""
+        set_content(SERVICE_ACCOUNT_JSON.decode())
+
+        initialize_google_genai()
+
+        from_info.assert_called_once_with(SERVICE_ACCOUNT_INFO)
+        assert get_google_credentials() == "credentials"
+        assert "GOOGLE_APPLICATION_CREDENTIALS" not in google_creds.os.environ
+
+    def test_path_is_exported(self, set_content, from_info, tmp_path):
+        """Test an existing file path is exported for google-auth to read."""
+        path = tmp_path / "credentials.json"
+        path.write_bytes(SERVICE_ACCOUNT_JSON)
+        set_content(str(path))
+
+        initialize_google_genai()
+
+        assert google_creds.os.environ["GOOGLE_APPLICATION_CREDENTIALS"] == str(path)
+        assert get_google_credentials() is None
+        from_info.assert_not_called()
+
+    def test_over_long_value_skips_path_lookup(
+        self, set_content, from_info, monkeypatch
+    ):
+        """Test a value too long to be a path never touches the filesystem."""
+        exists = Mock(return_value=True)
+        monkeypatch.setattr(google_creds.os.path, "exists", exists)
+        set_content("x" * google_creds._MAX_CREDENTIALS_PATH_LENGTH)
+
+        initialize_google_genai()
+
+        exists.assert_not_called()
+        assert get_google_credentials() is None
+        assert "GOOGLE_APPLICATION_CREDENTIALS" not in google_creds.os.environ
+
+    def test_invalid_json_is_rejected(self, set_content, from_info):
+        """Test malformed JSON content leaves no credentials loaded."""
+        set_content('{"type": "service_account",')
+
+        initialize_google_genai()
+
+        from_info.assert_not_called()
+        assert get_google_credentials() is None
+
+    def test_unrecognised_content_is_not_logged(
+        self, set_content, from_info, monkeypatch
+    ):
+        """Test the warning for unrecognised content reveals only its length."""
+        secret = "not-a-credential-secret-value"
+        set_content(secret)
+
+        with capture_logs() as logs:
+            # The module logger keeps the processors it was first used with
+            monkeypatch.setattr(google_creds, "logger", structlog.get_logger())
+            initialize_google_genai()
+
+        assert logs
+        assert all(secret[:8] not in str(entry) for entry in logs)
+        assert str(len(secret)) in logs[-1]["event"]
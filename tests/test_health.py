@@ -1,21 +1,14 @@
 """Tests for the health route."""
 
-from fastapi.testclient import TestClient
-
-from template_agent.src.routes.health import router
+# Mounted by the shared client fixture in conftest.py
+from template_agent.src.routes.health import router as router
 
 
 class TestHealthRoute:
     """Test cases for health endpoint."""
 
-    def test_health_endpoint(self):
+    def test_health_endpoint(self, client):
         """Test health endpoint returns correct response."""
-        from fastapi import FastAPI
-
-        app = FastAPI()
-        app.include_router(router)
-        client = TestClient(app)
-
         response = client.get("/health")
         assert response.status_code == 200
 
@@ -23,13 +16,7 @@ class TestHealthRoute:
         assert data["status"] == "healthy"
         assert data["service"] == "Template Agent"
 
-    def test_health_endpoint_content_type(self):
+    def test_health_endpoint_content_type(self, client):
         """Test health endpoint returns correct content type."""
-        from fastapi import FastAPI
-
-        app = FastAPI()
-        app.include_router(router)
-        client = TestClient(app)
-
         response = client.get("/health")
         assert response.headers["content-type"] == "application/json"
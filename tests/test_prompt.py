@@ -29,3 +29,13 @@ class TestPrompt:
         mock_get_date.return_value = "December 25, 2024"
         prompt = get_system_prompt()
         assert "Today's date is December 25, 2024" in prompt
+
+    @patch("template_agent.src.core.prompt.get_current_date")
+    def test_get_system_prompt_rebuilt_on_new_date(self, mock_get_date):
+        """Test the prompt is reused within a day and rebuilt when the date changes."""
+        mock_get_date.return_value = "December 25, 2024"
+        first = get_system_prompt()
+        assert get_system_prompt() is first
+
+        mock_get_date.return_value = "December 26, 2024"
+        assert "Today's date is December 26, 2024" in get_system_prompt()
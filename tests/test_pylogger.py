@@ -0,0 +1,178 @@
+"""Tests for the structured logger utility."""
+
+import io
+import logging
+import time
+
+import pytest
+import structlog
+from structlog.testing import capture_logs
+
+from template_agent.utils.pylogger import (
+    BufferedStreamHandler,
+    _fast_level_filter,
+    force_reconfigure_all_loggers,
+    get_python_logger,
+    get_uvicorn_log_config,
+)
+
+
+@pytest.fixture(autouse=True)
+def _restore_logging():
+    """Put logging back to the INFO default after each test."""
+    yield
+    force_reconfigure_all_loggers("INFO")
+
+
+def _record(level: int = logging.INFO, msg: str = "hello") -> logging.LogRecord:
+    """Build a bare log record at the given level."""
+    return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+
+
+class TestBufferedStreamHandler:
+    """Test cases for the batching stream handler."""
+
+    def test_info_records_are_held_until_flush(self):
+        """Test records below ERROR are buffered rather than written."""
+        stream = io.StringIO()
+        handler = BufferedStreamHandler(stream, max_age=60)
+
+        handler.handle(_record(msg="one"))
+        handler.handle(_record(msg="two"))
+        assert stream.getvalue() == ""
+
+        handler.flush()
+        assert stream.getvalue() == "one\ntwo\n"
+
+    def test_error_record_writes_pending_batch(self):
+        """Test an ERROR record writes itself and everything before it."""
+        stream = io.StringIO()
+        handler = BufferedStreamHandler(stream, max_age=60)
+
+        handler.handle(_record(msg="one"))
+        handler.handle(_record(logging.ERROR, "boom"))
+
+        assert stream.getvalue() == "one\nboom\n"
+
+    def test_full_buffer_is_written(self):
+        """Test the batch is written once it reaches the buffer size."""
+        stream = io.StringIO()
+        handler = BufferedStreamHandler(stream, buffer_size=8, max_age=60)
+
+        handler.handle(_record(msg="abc"))
+        assert stream.getvalue() == ""
+
+        handler.handle(_record(msg="defg"))
+        assert stream.getvalue() == "abc\ndefg\n"
+
+    def test_stale_buffer_is_written(self):
+        """Test a record arriving after max_age writes the batch."""
+        stream = io.StringIO()
+        handler = BufferedStreamHandler(stream, max_age=0)
+
+        handler.handle(_record(msg="one"))
+
+        assert stream.getvalue() == "one\n"
+
+    def test_idle_buffer_is_written_by_flush_thread(self):
+        """Test pending records are written after max_age with no new records."""
+        stream = io.StringIO()
+        handler = BufferedStreamHandler(stream, max_age=0.01)
+
+        handler.handle(_record(msg="one"))
+        time.sleep(0.1)
+
+        assert stream.getvalue() == "one\n"
+        handler.close()
+
+    def test_close_writes_pending_records(self):
+        """Test closing the handler writes what is still buffered."""
+        stream = io.StringIO()
+        handler = BufferedStreamHandler(stream, max_age=60)
+
+        handler.handle(_record(msg="one"))
+        handler.close()
+
+        assert stream.getvalue() == "one\n"
+
+    def test_close_twice(self):
+        """Test a second close is a no-op, as logging.shutdown may issue one."""
+        stream = io.StringIO()
+        handler = BufferedStreamHandler(stream, max_age=0.01)
+        handler.handle(_record(msg="one"))
+
+        handler.close()
+        stream.close()
+        handler.close()
+        time.sleep(0.05)
+
+
+class TestUvicornLogConfig:
+    """Test cases for the uvicorn logging config."""
+
+    def test_handlers_use_buffered_stream_handler(self):
+        """Test both uvicorn handlers batch their writes."""
+        handlers = get_uvicorn_log_config("info")["handlers"]
+
+        for handler in handlers.values():
+            assert handler["class"].endswith(".BufferedStreamHandler")
+
+
+class TestFastLevelFilter:
+    """Test cases for the leading level filter processor."""
+
+    def test_reconfigure_changes_threshold(self):
+        """Test force_reconfigure_all_loggers moves the level for every logger."""
+        force_reconfigure_all_loggers("WARNING")
+        with pytest.raises(structlog.DropEvent):
+            _fast_level_filter(None, "info", {})
+        assert _fast_level_filter(None, "exception", {"a": 1}) == {"a": 1}
+
+        force_reconfigure_all_loggers("DEBUG")
+        assert _fast_level_filter(None, "debug", {}) == {}
+
+
+class TestThirdPartyConfig:
+    """Test cases for the stdlib config applied on first use."""
+
+    def test_third_party_levels(self):
+        """Test third-party loggers follow the level, ML/AI ones stay at ERROR."""
+        force_reconfigure_all_loggers("WARNING")
+
+        assert logging.getLogger("httpx").level == logging.WARNING
+        assert logging.getLogger("transformers").level == logging.ERROR
+        assert logging.getLogger().handlers
+
+
+class TestGetPythonLogger:
+    """Test cases for the structlog logger factory."""
+
+    def test_name_is_bound(self):
+        """Test the given name is attached to every event as logger."""
+        with capture_logs() as logs:
+            get_python_logger(name="tests.example").info("hello")
+
+        assert logs[0]["logger"] == "tests.example"
+        assert logs[0]["event"] == "hello"
+
+    def test_later_level_applies_to_existing_loggers(self, capsysbinary):
+        """Test requesting a logger at a new level moves every logger to it."""
+        force_reconfigure_all_loggers("INFO")
+        logger = get_python_logger("INFO", name="tests.early")
+
+        get_python_logger("WARNING", name="tests.late")
+        logger.info("dropped")
+        logger.warning("kept")
+
+        out = capsysbinary.readouterr().out
+        assert b"dropped" not in out
+        assert b"kept" in out
+
+    def test_default_level_keeps_the_configured_one(self):
+        """Test a call without a level does not reset a configured level."""
+        force_reconfigure_all_loggers("WARNING")
+
+        get_python_logger(name="tests.default")
+
+        with pytest.raises(structlog.DropEvent):
+            _fast_level_filter(None, "info", {})
@@ -1,5 +1,8 @@
 """Tests for the schema module."""
 
+import pytest
+from pydantic import ValidationError
+
 from template_agent.src.schema import (
     ChatHistoryResponse,
     ChatMessage,
@@ -11,6 +14,23 @@ from template_agent.src.schema import (
 )
 
 
+def _build(cls, **kwargs):
+    """Build a model without validation, for inputs that are not under test."""
+    return cls.model_construct(**kwargs)
+
+
+@pytest.fixture(scope="module")
+def human_msg():
+    """Human ChatMessage shared by the tests in this module."""
+    return _build(ChatMessage, type="human", content="Hello")
+
+
+@pytest.fixture(scope="module")
+def ai_msg():
+    """AI ChatMessage shared by the tests in this module."""
+    return _build(ChatMessage, type="ai", content="Hi there")
+
+
 class TestUserInput:
     """Test cases for UserInput model."""
 
@@ -51,6 +71,12 @@ class TestStreamRequest:
         assert stream_request.message == "Hello world"
         assert stream_request.stream_tokens is False
 
+    def test_stream_request_is_immutable(self):
+        """Test StreamRequest rejects assignment after validation."""
+        stream_request = StreamRequest(message="Hello world")
+        with pytest.raises(ValidationError):
+            stream_request.message = "Changed"
+
 
 class TestToolCall:
     """Test cases for ToolCall TypedDict."""
@@ -73,44 +99,61 @@ class TestToolCall:
 class TestChatMessage:
     """Test cases for ChatMessage model."""
 
-    def test_chat_message_human(self):
-        """Test creating human ChatMessage."""
-        message = ChatMessage(type="human", content="Hello")
-        assert message.type == "human"
-        assert message.content == "Hello"
-        assert message.tool_calls == []
-        assert message.tool_call_id is None
-        assert message.run_id is None
-        assert message.response_metadata == {}
-        assert message.custom_data == {}
-
-    def test_chat_message_ai(self):
-        """Test creating AI ChatMessage."""
-        message = ChatMessage(
-            type="ai",
-            content="Hello",
-            tool_calls=[{"name": "test_tool", "args": {}, "id": "call_123"}],
-        )
-        assert message.type == "ai"
-        assert message.content == "Hello"
-        assert len(message.tool_calls) == 1
-        assert message.tool_calls[0]["name"] == "test_tool"
-
-    def test_chat_message_tool(self):
-        """Test creating tool ChatMessage."""
-        message = ChatMessage(
-            type="tool", content="Tool result", tool_call_id="call_123"
-        )
-        assert message.type == "tool"
-        assert message.content == "Tool result"
-        assert message.tool_call_id == "call_123"
-
-    def test_chat_message_custom(self):
-        """Test creating custom ChatMessage."""
-        message = ChatMessage(type="custom", content="", custom_data={"key": "value"})
-        assert message.type == "custom"
-        assert message.content == ""
-        assert message.custom_data == {"key": "value"}
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            pytest.param(
+                {"type": "human", "content": "Hello"},
+                {
+                    "type": "human",
+                    "content": "Hello",
+                    "tool_calls": [],
+                    "tool_call_id": None,
+                    "run_id": None,
+                    "response_metadata": {},
+                    "custom_data": {},
+                },
+                id="human",
+            ),
+            pytest.param(
+                {
+                    "type": "ai",
+                    "content": "Hello",
+                    "tool_calls": [{"name": "test_tool", "args": {}, "id": "call_123"}],
+                },
+                {
+                    "type": "ai",
+                    "content": "Hello",
+                    "tool_calls": [{"name": "test_tool", "args": {}, "id": "call_123"}],
+                },
+                id="ai",
+            ),
+            pytest.param(
+                {"type": "tool", "content": "Tool result", "tool_call_id": "call_123"},
+                {"type": "tool", "content": "Tool result", "tool_call_id": "call_123"},
+                id="tool",
+            ),
+            pytest.param(
+                {"type": "custom", "content": "", "custom_data": {"key": "value"}},
+                {"type": "custom", "content": "", "custom_data": {"key": "value"}},
+                id="custom",
+            ),
+        ],
+    )
+    def test_chat_message(self, kwargs, expected):
+        """Test creating each type of ChatMessage."""
+        message = ChatMessage(**kwargs)
+        for field, value in expected.items():
+            assert getattr(message, field) == value
+
+    def test_chat_message_defaults_are_not_shared(self):
+        """Test fresh messages get their own mutable defaults."""
+        first = ChatMessage(type="human", content="Hello")
+        second = ChatMessage(type="human", content="Hello")
+
+        assert first.tool_calls is not second.tool_calls
+        assert first.response_metadata is not second.response_metadata
+        assert first.custom_data is not second.custom_data
 
 
 class TestFeedbackRequest:
@@ -147,13 +190,9 @@ class TestFeedbackResponse:
 class TestChatHistoryResponse:
     """Test cases for ChatHistoryResponse model."""
 
-    def test_chat_history_response_creation(self):
+    def test_chat_history_response_creation(self, human_msg, ai_msg):
         """Test creating ChatHistoryResponse."""
-        messages = [
-            ChatMessage(type="human", content="Hello"),
-            ChatMessage(type="ai", content="Hi there"),
-        ]
-        response = ChatHistoryResponse(messages=messages)
+        response = ChatHistoryResponse(messages=[human_msg, ai_msg])
         assert len(response.messages) == 2
         assert response.messages[0].type == "human"
         assert response.messages[1].type == "ai"
@@ -0,0 +1,35 @@
+"""Tests for the in-memory storage module."""
+
+import pytest
+
+from template_agent.src.core.storage import (
+    get_global_checkpoint,
+    get_user_threads,
+    register_thread,
+    reset_global_storage,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_storage():
+    """Start every test from empty storage."""
+    reset_global_storage()
+    yield
+
+
+class TestGlobalStorage:
+    """Test cases for the global checkpoint and thread registry."""
+
+    def test_checkpoint_is_shared(self):
+        """Test repeated calls return the same checkpoint instance."""
+        assert get_global_checkpoint() is get_global_checkpoint()
+
+    def test_reset_replaces_checkpoint_and_threads(self):
+        """Test reset drops the cached checkpoint and registered threads."""
+        checkpoint = get_global_checkpoint()
+        register_thread("user_1", "thread_1")
+
+        reset_global_storage()
+
+        assert get_global_checkpoint() is not checkpoint
+        assert get_user_threads("user_1") == []
@@ -0,0 +1,136 @@
+"""Tests for the stream route."""
+
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from template_agent.src.routes.stream import _coalesce_events, message_generator
+from template_agent.src.schema import StreamRequest
+
+
+async def _events(*events, delay=0.0, error=None):
+    """Yield the given events, optionally sleeping between them and failing."""
+    for event in events:
+        if delay:
+            await asyncio.sleep(delay)
+        yield event
+    if error is not None:
+        raise error
+
+
+class TestCoalesceEvents:
+    """Test cases for token event coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_consecutive_tokens_are_batched(self, collect):
+        """Test tokens arriving together are sent as a single chunk."""
+        events = [{"type": "token", "content": c} for c in ("a", "b", "c")]
+
+        chunks = await collect(_coalesce_events(_events(*events)))
+
+        assert chunks == [b"".join(orjson.dumps(e) + b"\n\n" for e in events)]
+
+    @pytest.mark.asyncio
+    async def test_message_event_flushes_immediately(self, collect):
+        """Test a message event flushes buffered tokens together with itself."""
+        token = {"type": "token", "content": "Hi"}
+        message = {"type": "message", "content": {"type": "ai", "content": "Hi"}}
+
+        chunks = await collect(_coalesce_events(_events(token, message, token)))
+
+        assert chunks == [
+            orjson.dumps(token) + b"\n\n" + orjson.dumps(message) + b"\n\n",
+            orjson.dumps(token) + b"\n\n",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_slow_tokens_are_not_held_back(self, collect):
+        """Test tokens spaced beyond the window are flushed separately."""
+        events = [{"type": "token", "content": c} for c in ("a", "b")]
+
+        chunks = await collect(_coalesce_events(_events(*events, delay=0.05)))
+
+        assert chunks == [orjson.dumps(e) + b"\n\n" for e in events]
+
+    @pytest.mark.asyncio
+    async def test_error_is_raised_after_flushing_buffer(self):
+        """Test producer errors propagate once buffered tokens are sent."""
+        token = {"type": "token", "content": "a"}
+        chunks = []
+
+        with pytest.raises(RuntimeError, match="boom"):
+            async for chunk in _coalesce_events(
+                _events(token, error=RuntimeError("boom"))
+            ):
+                chunks.append(chunk)
+
+        assert chunks == [orjson.dumps(token) + b"\n\n"]
+
+    @pytest.mark.asyncio
+    async def test_read_ahead_is_bounded(self, monkeypatch):
+        """Test a stalled consumer stops the producer at the queue size."""
+        monkeypatch.setattr(
+            "template_agent.src.routes.stream.SSE_COALESCE_QUEUE_SIZE", 2
+        )
+        pulled = 0
+
+        async def source():
+            nonlocal pulled
+            for i in range(100):
+                pulled += 1
+                yield {"type": "message", "content": i}
+
+        chunks = _coalesce_events(source())
+        await anext(chunks)
+        await asyncio.sleep(0.01)
+
+        assert pulled <= 4
+        await chunks.aclose()
+
+    @pytest.mark.asyncio
+    async def test_close_unwinds_source(self, monkeypatch):
+        """Test closing the stream runs the source's cleanup before returning."""
+        monkeypatch.setattr(
+            "template_agent.src.routes.stream.SSE_COALESCE_QUEUE_SIZE", 1
+        )
+        closed = False
+
+        async def source():
+            nonlocal closed
+            try:
+                for i in range(100):
+                    yield {"type": "message", "content": i}
+            finally:
+                closed = True
+
+        chunks = _coalesce_events(source())
+        await anext(chunks)
+        await asyncio.sleep(0.01)
+        await chunks.aclose()
+
+        assert closed
+
+
+class TestMessageGenerator:
+    """Test cases for the SSE message generator."""
+
+    @pytest.mark.asyncio
+    async def test_error_event_and_done_marker(self, collect, monkeypatch):
+        """Test a failing agent stream ends with an error event and [DONE]."""
+        request = SimpleNamespace(headers={})
+        manager = SimpleNamespace(
+            stream_response=lambda *args, **kwargs: _events(error=RuntimeError("boom"))
+        )
+        monkeypatch.setattr(
+            "template_agent.src.routes.stream.AgentManager",
+            lambda *args, **kwargs: manager,
+        )
+
+        chunks = await collect(
+            message_generator(StreamRequest(message="Hello"), request)
+        )
+
+        assert orjson.loads(chunks[0])["content"]["error_type"] == "stream_error"
+        assert chunks[-1] == b"[DONE]\n\n"
@@ -0,0 +1,134 @@
+"""Tests for the threads route."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from template_agent.src.routes.threads import router, stream_json_array
+
+
+class _FakeCursor:
+    """Server-side cursor stand-in returning a first batch, then the rest."""
+
+    def __init__(self, first=(), rest=(), error=None, execute_error=None):
+        self.first = [(thread_id,) for thread_id in first]
+        self.rest = [(thread_id,) for thread_id in rest]
+        self.error = error
+        self.execute = AsyncMock(side_effect=execute_error)
+        self.close = AsyncMock()
+
+    async def fetchmany(self, size):
+        return self.first
+
+    async def __aiter__(self):
+        for row in self.rest:
+            yield row
+        if self.error is not None:
+            raise self.error
+
+
+def _fake_pool(cur, rollback_error=None):
+    """Build a pool whose single connection hands out ``cur``."""
+    conn = SimpleNamespace(
+        cursor=Mock(return_value=cur), rollback=AsyncMock(side_effect=rollback_error)
+    )
+    return SimpleNamespace(getconn=AsyncMock(return_value=conn), putconn=AsyncMock())
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    """Return a factory for test clients backed by a fake connection pool."""
+    monkeypatch.setattr(
+        "template_agent.src.routes.threads.settings.USE_INMEMORY_SAVER", False
+    )
+
+    def _make(pool):
+        app = FastAPI()
+        app.include_router(router)
+        app.state.db_pool = pool
+        return TestClient(app)
+
+    return _make
+
+
+class TestStreamJsonArray:
+    """Test cases for streaming thread IDs as a JSON array."""
+
+    @pytest.mark.asyncio
+    async def test_prefetched_and_cursor_rows_form_one_array(self, collect):
+        """Test prefetched rows and cursor rows are joined into valid JSON."""
+        cur = _FakeCursor(rest=["t2", "t3"])
+
+        chunks = await collect(stream_json_array([("t1",)], cur, "user"))
+
+        assert orjson.loads(b"".join(chunks)) == ["t1", "t2", "t3"]
+
+    @pytest.mark.asyncio
+    async def test_no_rows_is_an_empty_array(self, collect):
+        """Test a user without threads gets an empty array."""
+        chunks = await collect(stream_json_array([], _FakeCursor(), "user"))
+
+        assert b"".join(chunks) == b"[]"
+
+    @pytest.mark.asyncio
+    async def test_mid_stream_error_is_raised_not_closed(self):
+        """Test a cursor error propagates instead of closing the array."""
+        cur = _FakeCursor(rest=["t2"], error=RuntimeError("connection lost"))
+        chunks = []
+
+        with pytest.raises(RuntimeError, match="connection lost"):
+            async for chunk in stream_json_array([("t1",)], cur, "user"):
+                chunks.append(chunk)
+
+        assert not b"".join(chunks).endswith(b"]")
+
+
+class TestListThreads:
+    """Test cases for the threads endpoint."""
+
+    def test_threads_are_streamed_and_connection_released(self, make_client):
+        """Test the thread IDs are returned and the connection goes back."""
+        cur = _FakeCursor(first=["t1"], rest=["t2"])
+        pool = _fake_pool(cur)
+
+        response = make_client(pool).get("/v1/threads/user")
+
+        assert response.status_code == 200
+        assert response.json() == ["t1", "t2"]
+        cur.close.assert_awaited_once()
+        pool.putconn.assert_awaited_once()
+
+    def test_connection_released_on_mid_stream_error(self, make_client):
+        """Test the connection is returned when the cursor fails mid-stream."""
+        cur = _FakeCursor(first=["t1"], error=RuntimeError("connection lost"))
+        pool = _fake_pool(cur)
+
+        with pytest.raises(RuntimeError, match="connection lost"):
+            make_client(pool).get("/v1/threads/user")
+
+        pool.putconn.assert_awaited_once()
+
+    def test_query_error_returns_500_and_releases(self, make_client):
+        """Test a failing query maps to a 500 and still releases the connection."""
+        cur = _FakeCursor(execute_error=RuntimeError("bad query"))
+        pool = _fake_pool(cur)
+
+        response = make_client(pool).get("/v1/threads/user")
+
+        assert response.status_code == 500
+        pool.putconn.assert_awaited_once()
+
+    def test_release_error_does_not_mask_500(self, make_client):
+        """Test a failing rollback during cleanup still yields the 500."""
+        cur = _FakeCursor(execute_error=RuntimeError("bad query"))
+        pool = _fake_pool(cur, rollback_error=RuntimeError("rollback failed"))
+
+        response = make_client(pool).get("/v1/threads/user")
+
+        assert response.status_code == 500
+        assert "bad query" in response.json()["detail"]
+        pool.putconn.assert_awaited_once()